@@ -88,7 +88,7 @@ def check(
     )
 
     # Get projects and repo paths
-    projects = list_projects(state.db)
+    projects = list_projects(state.db, load_tags=False)
 
     repo_paths_by_project: dict[int, list[Path]] = {}
     for p in projects:
@@ -121,7 +121,7 @@ def _print_all_text_output(result: AllProjectsFetchResult) -> None:
 
 def _fetch_all_projects(target_date: str, total_hours: float) -> None:
     """Fetch commits across all registered projects and suggest a time split."""
-    projects = list_projects(state.db)
+    projects = list_projects(state.db, load_tags=False)
     if not projects:
         typer.echo(
             "Error: No projects registered. Use 'timereg init' or 'timereg projects add'.", err=True
@@ -80,7 +80,7 @@ def list_cmd(
     show_project = all_projects or project_id is None
     project_names: dict[int, str] = {}
     if show_project:
-        for p in list_projects(state.db):
+        for p in list_projects(state.db, load_tags=False):
             if p.id is not None:
                 project_names[p.id] = p.name
 
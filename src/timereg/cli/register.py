@@ -177,7 +177,7 @@ def register(
     )
     if week_entries:
         project_names: dict[int, str] = {}
-        for p in list_projects(state.db):
+        for p in list_projects(state.db, load_tags=False):
             if p.id is not None:
                 project_names[p.id] = p.name
 
@@ -7,7 +7,7 @@ from datetime import date, timedelta
 from typing import TYPE_CHECKING
 
 from timereg.core.entries import get_registered_commit_hashes, list_entries
-from timereg.core.git import fetch_commits
+from timereg.core.git import fetch_commit_hashes
 from timereg.core.models import CheckReport, DayCheck, ProjectStatus, StatusReport
 
 if TYPE_CHECKING:
@@ -41,13 +41,12 @@ def _count_unregistered_commits(
         if not repo_path.is_dir():
             continue
         try:
-            commits = fetch_commits(
-                repo_path=str(repo_path),
+            hashes = fetch_commit_hashes(
+                repo_path=repo_path,
                 target_date=target_date,
                 user_email=user_email,
-                registered_hashes=registered,
             )
-            total += len(commits)
+            total += len(hashes - registered)
         except Exception:
             logger.warning("Failed to fetch commits from %s", repo_path)
     return total
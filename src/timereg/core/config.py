@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import sys
 import tomllib
 from pathlib import Path
@@ -20,8 +21,13 @@ def _get_home_dir() -> Path:
 def find_project_config(start: Path | None = None) -> Path | None:
     """Walk up from start directory to find .timereg.toml.
 
-    Stops at the user's home directory. Returns None if not found.
+    Without a start directory, TIMEREG_PROJECT_CONFIG names the file directly and no
+    walk from the CWD is done. Stops at the user's home directory. Returns None if not
+    found.
     """
+    if start is None and (env_config := os.environ.get("TIMEREG_PROJECT_CONFIG")):
+        env_path = Path(env_config)
+        return env_path if env_path.is_file() else None
     current = (start or Path.cwd()).resolve()
     home = _get_home_dir().resolve()
 
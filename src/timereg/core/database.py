@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sqlite3
+from contextlib import closing
 from pathlib import Path
 from typing import Any
 
@@ -12,9 +13,20 @@ class Database:
 
     def __init__(self, db_path: str | Path) -> None:
         self.path = Path(db_path)
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(str(self.path))
+        # "file:" paths are SQLite URIs, e.g. file:name?mode=memory&cache=shared for an
+        # in-memory database shared by every connection in the process.
+        uri = str(db_path).startswith("file:")
+        if not uri:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Statements are built from a small set of shapes (optional filter clauses), so
+        # a larger statement cache keeps all of them prepared for the connection's life.
+        self._conn = sqlite3.connect(str(db_path), cached_statements=256, uri=uri)
         self._conn.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode NORMAL only syncs at checkpoints and stays corruption-safe; a
+        # power loss can at worst drop the last few commits.
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=268435456")
         self._conn.execute("PRAGMA foreign_keys=ON")
 
     def execute(self, sql: str, params: tuple[Any, ...] = ()) -> sqlite3.Cursor:
@@ -26,6 +38,14 @@ class Database:
     def commit(self) -> None:
         self._conn.commit()
 
+    def rollback(self) -> None:
+        self._conn.rollback()
+
+    def load(self, source: str | Path) -> None:
+        """Replace this database's contents with a copy of the database file at source."""
+        with closing(sqlite3.connect(source)) as src:
+            src.backup(self._conn)
+
     def close(self) -> None:
         self._conn.close()
 
@@ -4,13 +4,12 @@ from __future__ import annotations
 
 import json
 import uuid
+from datetime import date
 from typing import TYPE_CHECKING
 
 from timereg.core.models import Entry
 
 if TYPE_CHECKING:
-    from datetime import date
-
     from timereg.core.database import Database
     from timereg.core.models import CommitInfo
 
@@ -25,8 +24,11 @@ def _validate_tags(tags: list[str] | None, allowed_tags: list[str] | None) -> No
         raise ValueError(msg)
 
 
-def _row_to_entry(row: tuple[object, ...]) -> Entry:
-    """Convert a database row to an Entry model."""
+def _row_to_entry(row: tuple[object, ...], load_tags: bool = True) -> Entry:
+    """Convert a database row to an Entry model.
+
+    With load_tags=False the JSON tags column is not decoded and tags is left as None.
+    """
     return Entry(
         id=row[0],
         project_id=row[1],
@@ -37,7 +39,7 @@ def _row_to_entry(row: tuple[object, ...]) -> Entry:
         short_summary=row[6],
         long_summary=row[7],
         entry_type=row[8],
-        tags=json.loads(str(row[9])) if row[9] else None,
+        tags=json.loads(str(row[9])) if load_tags and row[9] else None,
         peer_group_id=row[10],
         split_group_id=row[11],
         created_at=row[12],
@@ -101,14 +103,17 @@ def _insert_entry(
     if row is None:
         msg = "Failed to retrieve inserted entry"
         raise RuntimeError(msg)
-    return _row_to_entry(row)
+    # Tags were just serialized from the caller's list; no need to decode them again
+    entry = _row_to_entry(row, load_tags=False)
+    entry.tags = tags or None
+    return entry
 
 
 def _insert_commits(db: Database, entry_id: int, commits: list[CommitInfo]) -> None:
     """Insert commit associations for an entry."""
     for c in commits:
         db.execute(
-            "INSERT INTO entry_commits "
+            "INSERT OR IGNORE INTO entry_commits "
             "(entry_id, commit_hash, repo_path, message, author_name, "
             "author_email, timestamp, files_changed, insertions, deletions) "
             "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
@@ -264,24 +269,19 @@ def delete_entry(
         raise ValueError(msg)
 
     project_id, peer_group_id = row
-    ids_to_delete = [entry_id]
     if delete_peers and peer_group_id:
-        peer_rows = db.execute(
-            "SELECT id FROM entries WHERE peer_group_id=?", (peer_group_id,)
-        ).fetchall()
-        ids_to_delete = [r[0] for r in peer_rows]
-
-    for eid in ids_to_delete:
-        if not release_commits:
-            commit_rows = db.execute(
-                "SELECT commit_hash FROM entry_commits WHERE entry_id=?", (eid,)
-            ).fetchall()
-            for crow in commit_rows:
-                db.execute(
-                    "INSERT INTO claimed_commits (commit_hash, project_id) VALUES (?, ?)",
-                    (crow[0], project_id),
-                )
-        db.execute("DELETE FROM entries WHERE id=?", (eid,))
+        where, params = "peer_group_id=?", (peer_group_id,)
+    else:
+        where, params = "id=?", (entry_id,)
+
+    if not release_commits:
+        db.execute(
+            "INSERT INTO claimed_commits (commit_hash, project_id) "
+            "SELECT ec.commit_hash, ? FROM entry_commits ec "
+            f"WHERE ec.entry_id IN (SELECT id FROM entries WHERE {where})",
+            (project_id, *params),
+        )
+    db.execute(f"DELETE FROM entries WHERE {where}", params)
 
     db.commit()
 
@@ -304,15 +304,15 @@ def undo_last(db: Database, user_email: str) -> Entry | None:
     return entry
 
 
-def list_entries(
-    db: Database,
-    project_id: int | None = None,
-    date_filter: date | None = None,
-    date_from: date | None = None,
-    date_to: date | None = None,
-    all_projects: bool = False,
-) -> list[Entry]:
-    """List entries with optional filters."""
+def _entry_filters(
+    project_id: int | None,
+    date_filter: date | None,
+    date_from: date | None,
+    date_to: date | None,
+    all_projects: bool,
+    tag_filter: list[str] | None,
+) -> tuple[str, tuple[object, ...]]:
+    """Build the WHERE clause and parameters shared by entry listings and aggregates."""
     conditions: list[str] = []
     params: list[object] = []
 
@@ -328,27 +328,95 @@ def list_entries(
     if date_to is not None:
         conditions.append("date<=?")
         params.append(date_to.isoformat())
+    if tag_filter:
+        placeholders = ", ".join("?" * len(tag_filter))
+        conditions.append(
+            f"EXISTS (SELECT 1 FROM json_each(entries.tags) WHERE value IN ({placeholders}))"
+        )
+        params.extend(tag_filter)
 
     where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    return where, tuple(params)
+
+
+def list_entries(
+    db: Database,
+    project_id: int | None = None,
+    date_filter: date | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    all_projects: bool = False,
+    tag_filter: list[str] | None = None,
+) -> list[Entry]:
+    """List entries with optional filters.
+
+    tag_filter keeps only entries with at least one of the given tags; it is matched
+    in SQL against the JSON tags column so non-matching rows are never decoded.
+    """
+    where, params = _entry_filters(
+        project_id, date_filter, date_from, date_to, all_projects, tag_filter
+    )
     rows = db.execute(
         f"SELECT {_ENTRY_COLUMNS} FROM entries{where} ORDER BY date, project_id, created_at",
-        tuple(params),
+        params,
     ).fetchall()
     return [_row_to_entry(r) for r in rows]
 
 
+def list_entries_with_totals(
+    db: Database,
+    project_id: int | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    all_projects: bool = False,
+    tag_filter: list[str] | None = None,
+) -> list[tuple[Entry, float, float]]:
+    """List entries with their day and project hour totals, as (entry, day, project).
+
+    Takes the same filters as list_entries. The totals come from window functions over
+    the filtered rows, and rows are ordered by project, date and creation time.
+    """
+    where, params = _entry_filters(project_id, None, date_from, date_to, all_projects, tag_filter)
+    rows = db.execute(
+        f"SELECT {_ENTRY_COLUMNS}, "
+        "SUM(hours) OVER (PARTITION BY project_id, date), "
+        "SUM(hours) OVER (PARTITION BY project_id) "
+        f"FROM entries{where} ORDER BY project_id, date, created_at",
+        params,
+    ).fetchall()
+    return [(_row_to_entry(r), r[-2], r[-1]) for r in rows]
+
+
+def sum_hours_by_day(
+    db: Database,
+    project_id: int | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    all_projects: bool = False,
+    tag_filter: list[str] | None = None,
+) -> list[tuple[int, date, float]]:
+    """Total hours per (project_id, date), ordered by project then date.
+
+    Takes the same filters as list_entries but aggregates in SQLite, so no Entry
+    objects are built.
+    """
+    where, params = _entry_filters(project_id, None, date_from, date_to, all_projects, tag_filter)
+    rows = db.execute(
+        f"SELECT project_id, date, SUM(hours) FROM entries{where} "
+        "GROUP BY project_id, date ORDER BY project_id, date",
+        params,
+    ).fetchall()
+    return [(r[0], date.fromisoformat(r[1]), r[2]) for r in rows]
+
+
 def get_registered_commit_hashes(db: Database, project_id: int) -> set[str]:
     """Get all commit hashes registered or claimed for a project."""
-    entry_hashes = db.execute(
+    rows = db.execute(
         "SELECT ec.commit_hash FROM entry_commits ec "
         "JOIN entries e ON ec.entry_id = e.id "
-        "WHERE e.project_id=?",
-        (project_id,),
-    ).fetchall()
-
-    claimed_hashes = db.execute(
+        "WHERE e.project_id=? "
+        "UNION "
         "SELECT commit_hash FROM claimed_commits WHERE project_id=?",
-        (project_id,),
+        (project_id, project_id),
     ).fetchall()
-
-    return {r[0] for r in entry_hashes} | {r[0] for r in claimed_hashes}
+    return {r[0] for r in rows}
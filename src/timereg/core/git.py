@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from timereg.core.models import (
@@ -16,15 +20,21 @@ from timereg.core.models import (
 )
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Collection, Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
-_COMMIT_FORMAT = "%H%x00%s%x00%an%x00%ae%x00%aI"
-_COMMIT_SEPARATOR = "\x00"
+# Models in this module are built from git output we parse ourselves, so pydantic
+# models are created with model_construct() to skip per-instance validation.
 
+_COMMIT_FORMAT = "%x1e%H%x00%s%x00%an%x00%ae%x00%aI"
+_RECORD_SEPARATOR = b"\x1e"
+_FIELD_SEPARATOR = b"\x00"
+_MAX_GIT_WORKERS = 32
+_STREAM_CHUNK_SIZE = 1 << 16
 
-def _run_git(args: list[str], cwd: str) -> str:
+
+def _run_git(args: list[str], cwd: str | os.PathLike[str]) -> str:
     """Run a git command and return stdout. Raises on failure."""
     result = subprocess.run(
         ["git", *args],
@@ -36,76 +46,139 @@ def _run_git(args: list[str], cwd: str) -> str:
     return result.stdout
 
 
-def parse_log_output(output: str, repo_path: str) -> list[CommitInfo]:
-    """Parse `git log --format=... --numstat` output into CommitInfo objects."""
-    if not output.strip():
-        return []
-
-    commits: list[CommitInfo] = []
-    lines = output.strip().split("\n")
-    i = 0
+def _stream_git(args: list[str], cwd: str | os.PathLike[str]) -> Iterator[bytes]:
+    """Run a git command and yield raw stdout chunks as they are produced.
 
-    while i < len(lines):
-        line = lines[i].strip()
-        if not line:
-            i += 1
+    Raises CalledProcessError on failure, carrying git's error text like _run_git.
+    stderr is only drained once stdout is exhausted; git reports errors in a few
+    lines, well within the pipe buffer.
+    """
+    with subprocess.Popen(
+        ["git", *args],
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=_STREAM_CHUNK_SIZE,
+    ) as proc:
+        assert proc.stdout is not None
+        assert proc.stderr is not None
+        while chunk := proc.stdout.read(_STREAM_CHUNK_SIZE):
+            yield chunk
+        stderr = proc.stderr.read()
+        returncode = proc.wait()
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, ["git", *args], stderr=_decode(stderr))
+
+
+def _iter_records(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Reassemble streamed chunks into complete commit records."""
+    pending: list[bytes] = []
+    for chunk in chunks:
+        first, *complete = chunk.split(_RECORD_SEPARATOR)
+        pending.append(first)
+        if complete:
+            yield b"".join(pending)
+            yield from complete[:-1]
+            pending = [complete[-1]]
+    yield b"".join(pending)
+
+
+def _decode(value: bytes) -> str:
+    return value.decode("utf-8", "replace")
+
+
+def _parse_record(
+    record: bytes, repo_path: str, registered_hashes: Collection[str] | None = None
+) -> CommitInfo | None:
+    """Parse a single NUL-delimited commit record from `git log -z --numstat`.
+
+    The record is the five header fields followed by one "ins\\tdel\\tpath" field per
+    changed file. Renames and copies have an empty path, followed by the old and new
+    paths as two extra fields. Works on raw bytes: counts go straight through int(),
+    and only the header fields and filenames are decoded.
+
+    Commits in registered_hashes are dropped as soon as the hash is read, before the
+    rest of the record is split or parsed.
+    """
+    hash_end = record.find(_FIELD_SEPARATOR)
+    if hash_end < 0:
+        return None
+    hash_ = record[:hash_end].decode("ascii")
+    if registered_hashes and hash_ in registered_hashes:
+        return None
+
+    fields = record.split(_FIELD_SEPARATOR)
+    if len(fields) < 5:
+        return None
+
+    message, author_name, author_email, timestamp = fields[1:5]
+    files: list[str] = []
+    files_changed = 0
+    insertions = 0
+    deletions = 0
+
+    # Only the first stats field carries the newline git puts after the format line.
+    if len(fields) > 5 and fields[5][:1] == b"\n":
+        fields[5] = fields[5][1:]
+
+    stats = iter(fields[5:])
+    for stat in stats:
+        if b"\t" not in stat:
             continue
-
-        parts = line.split(_COMMIT_SEPARATOR, 4)
-        if len(parts) < 5:
-            i += 1
+        ins_str, _, rest = stat.partition(b"\t")
+        del_str, _, filename = rest.partition(b"\t")
+        if not del_str:
             continue
+        if not filename:
+            next(stats, None)
+            filename = next(stats, b"")
+        if ins_str != b"-":
+            insertions += int(ins_str)
+        if del_str != b"-":
+            deletions += int(del_str)
+        files.append(_decode(filename))
+        files_changed += 1
+
+    return CommitInfo(
+        hash=hash_,
+        message=_decode(message),
+        author_name=_decode(author_name),
+        author_email=_decode(author_email),
+        timestamp=timestamp.decode("ascii"),
+        repo_path=repo_path,
+        files_changed=files_changed,
+        insertions=insertions,
+        deletions=deletions,
+        files=files,
+    )
 
-        hash_, message, author_name, author_email, timestamp = parts
-        files: list[str] = []
-        insertions = 0
-        deletions = 0
-        i += 1
-
-        while i < len(lines):
-            stat_line = lines[i].strip()
-            if "\x00" in stat_line:
-                break
-            if not stat_line:
-                i += 1
-                continue
-            stat_parts = stat_line.split("\t")
-            if len(stat_parts) == 3:
-                ins_str, del_str, filename = stat_parts
-                ins = int(ins_str) if ins_str != "-" else 0
-                dels = int(del_str) if del_str != "-" else 0
-                insertions += ins
-                deletions += dels
-                files.append(filename)
-            i += 1
-
-        commits.append(
-            CommitInfo(
-                hash=hash_,
-                message=message,
-                author_name=author_name,
-                author_email=author_email,
-                timestamp=timestamp,
-                repo_path=repo_path,
-                files_changed=len(files),
-                insertions=insertions,
-                deletions=deletions,
-                files=files,
-            )
-        )
 
-    return commits
+def iter_commits(
+    records: Iterable[bytes],
+    repo_path: str,
+    registered_hashes: Collection[str] | None = None,
+) -> Iterator[CommitInfo]:
+    """Yield CommitInfo objects from commit records as each one becomes available."""
+    for record in records:
+        commit = _parse_record(record, repo_path, registered_hashes)
+        if commit is not None:
+            yield commit
 
 
-def fetch_commits(
-    repo_path: str,
-    target_date: str,
-    user_email: str,
-    timezone: str = "Europe/Oslo",
-    merge_commits: bool = False,
-    registered_hashes: set[str] | None = None,
+def parse_log_output(
+    output: bytes, repo_path: str, registered_hashes: Collection[str] | None = None
 ) -> list[CommitInfo]:
-    """Fetch commits for a specific date and author from a git repo."""
+    """Parse `git log -z --format=... --numstat` output into CommitInfo objects.
+
+    Each commit record starts with a record separator, so the output is split once
+    per commit and each record is split once on NUL into header and numstat fields.
+    Commits whose hash is in registered_hashes are skipped without being parsed.
+    """
+    return list(iter_commits(output.split(_RECORD_SEPARATOR), repo_path, registered_hashes))
+
+
+def _log_args(target_date: str, user_email: str, merge_commits: bool) -> list[str]:
+    """Build the `git log` arguments for one author's commits on target_date."""
     args = [
         "log",
         f"--after={target_date}T00:00:00",
@@ -113,62 +186,169 @@ def fetch_commits(
         f"--author={user_email}",
         f"--format={_COMMIT_FORMAT}",
         "--numstat",
+        "-z",
     ]
     if not merge_commits:
         args.append("--no-merges")
+    return args
 
-    output = _run_git(args, cwd=repo_path)
-    commits = parse_log_output(output, repo_path=repo_path)
 
-    if registered_hashes:
-        commits = [c for c in commits if c.hash not in registered_hashes]
+def fetch_commit_hashes(
+    repo_path: str | os.PathLike[str],
+    target_date: str,
+    user_email: str,
+    merge_commits: bool = False,
+) -> set[str]:
+    """Fetch only the hashes of an author's commits on target_date.
 
-    return commits
+    For callers that just count commits: no stats are requested from git and no
+    CommitInfo objects are built.
+    """
+    args = [
+        "log",
+        f"--after={target_date}T00:00:00",
+        f"--before={target_date}T23:59:59",
+        f"--author={user_email}",
+        "--format=%H",
+    ]
+    if not merge_commits:
+        args.append("--no-merges")
+    return set(_run_git(args, cwd=repo_path).split())
 
 
-def get_branch_info(repo_path: str, target_date: str | None = None) -> BranchInfo:
-    """Get current branch and branch activity for the day."""
+def _get_branch_activity(repo_path: str, target_date: str) -> list[str]:
+    """Get reflog subjects for branch activity since the start of target_date."""
     try:
-        current = _run_git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_path).strip()
+        reflog = _run_git(
+            ["reflog", f"--after={target_date}T00:00:00", "--format=%gs"],
+            cwd=repo_path,
+        )
     except subprocess.CalledProcessError:
-        current = "unknown"
-
-    activity: list[str] = []
-    if target_date:
-        try:
-            reflog = _run_git(
-                ["reflog", f"--after={target_date}T00:00:00", "--format=%gs"],
-                cwd=repo_path,
-            )
-            activity = [line.strip() for line in reflog.strip().split("\n") if line.strip()]
-        except subprocess.CalledProcessError:
-            pass
+        return []
+    return [line for line in reflog.splitlines() if line]
 
-    return BranchInfo(current=current, activity=activity)
+
+def get_branch_info(repo_path: str, target_date: str | None = None) -> BranchInfo:
+    """Get current branch and branch activity for the day."""
+    current, _ = get_repo_status(repo_path)
+    activity = _get_branch_activity(repo_path, target_date) if target_date else []
+    return BranchInfo.model_construct(current=current, activity=activity)
 
 
 def get_working_tree_status(repo_path: str) -> WorkingTreeStatus:
     """Get count of staged and unstaged changes."""
+    _, status = get_repo_status(repo_path)
+    return status
+
+
+def parse_status_output(output: str) -> tuple[str, WorkingTreeStatus]:
+    """Parse `git status --porcelain=v2 --branch -z` output into branch name and tree status.
+
+    Tracked entries carry an XY code where X is the staged state and Y the unstaged
+    state ("." meaning unmodified), matching what `git diff [--cached] --numstat` counts.
+    Rename/copy entries ("2 ") are followed by a separate field holding the original
+    path, which is skipped so an odd file name cannot be mistaken for an entry.
+    """
+    current = "unknown"
+    staged = 0
+    unstaged = 0
+    fields = iter(output.split("\0"))
+    for line in fields:
+        if line.startswith("# branch.head "):
+            head = line[len("# branch.head ") :]
+            current = "HEAD" if head == "(detached)" else head
+        elif line[:2] in ("1 ", "2 ", "u "):
+            xy = line[2:4]
+            if xy[0] != ".":
+                staged += 1
+            if xy[1] != ".":
+                unstaged += 1
+            if line[0] == "2":
+                next(fields, None)
+    return current, WorkingTreeStatus.model_construct(staged_files=staged, unstaged_files=unstaged)
+
+
+def get_repo_status(repo_path: str) -> tuple[str, WorkingTreeStatus]:
+    """Get the current branch and working tree status with a single git call."""
     try:
-        staged_output = _run_git(["diff", "--cached", "--numstat"], cwd=repo_path)
-        staged = len([line for line in staged_output.strip().split("\n") if line.strip()])
+        output = _run_git(
+            ["status", "--porcelain=v2", "--branch", "--untracked-files=no", "-z"],
+            cwd=repo_path,
+        )
     except subprocess.CalledProcessError:
-        staged = 0
+        return "unknown", WorkingTreeStatus.model_construct()
+    return parse_status_output(output)
 
-    try:
-        unstaged_output = _run_git(["diff", "--numstat"], cwd=repo_path)
-        unstaged = len([line for line in unstaged_output.strip().split("\n") if line.strip()])
-    except subprocess.CalledProcessError:
-        unstaged = 0
 
-    return WorkingTreeStatus(staged_files=staged, unstaged_files=unstaged)
+@functools.lru_cache(maxsize=64)
+def resolve_git_user(repo_path: str) -> GitUser:
+    """Resolve git user name and email from repo config.
 
+    Both keys are read with one `git config --get-regexp` call; the result is cached
+    per repo for the rest of the process. Raises CalledProcessError if either is unset.
+    """
+    output = _run_git(["config", "--get-regexp", r"^user\.(name|email)$"], cwd=repo_path)
+    values: dict[str, str] = {}
+    for line in output.splitlines():
+        key, _, value = line.partition(" ")
+        values[key] = value
+    if "user.name" not in values or "user.email" not in values:
+        raise subprocess.CalledProcessError(1, ["git", "config", "user.name", "user.email"])
+    return GitUser.model_construct(name=values["user.name"], email=values["user.email"])
 
-def resolve_git_user(repo_path: str) -> GitUser:
-    """Resolve git user name and email from repo config."""
-    name = _run_git(["config", "user.name"], cwd=repo_path).strip()
-    email = _run_git(["config", "user.email"], cwd=repo_path).strip()
-    return GitUser(name=name, email=email)
+
+@functools.lru_cache(maxsize=256)
+def _is_repo_dir(repo_path: str) -> bool:
+    """Cached is_dir() so fetching many dates does not stat every repo each time.
+
+    Results are never invalidated: a CLI run is short-lived, but anything that creates
+    or removes repos within one process must call _is_repo_dir.cache_clear().
+    """
+    return Path(repo_path).is_dir()
+
+
+@functools.lru_cache(maxsize=256)
+def _display_path(repo_path: Path, config_dir: Path | None) -> str:
+    """Repo path as shown in fetch output, relative to config_dir when given."""
+    return str(repo_path.relative_to(config_dir)) if config_dir else str(repo_path)
+
+
+def _fetch_repo(
+    repo_path: Path,
+    target_date: str,
+    user_email: str,
+    registered_hashes: set[str],
+    config_dir: Path | None,
+    merge_commits: bool,
+) -> RepoFetchResult | None:
+    """Fetch commits, branch and tree status for one repo. Returns None if skipped.
+
+    Commits are parsed as git streams them, so the log output is never held whole.
+    """
+    repo_str = os.fspath(repo_path)
+    if not _is_repo_dir(repo_str):
+        logger.warning("Repo path does not exist, skipping: %s", repo_path)
+        return None
+
+    try:
+        args = _log_args(target_date, user_email, merge_commits)
+        records = _iter_records(_stream_git(args, cwd=repo_str))
+        commits = list(iter_commits(records, repo_str, registered_hashes))
+    except subprocess.CalledProcessError:
+        logger.warning("Failed to fetch commits from %s, skipping", repo_path)
+        return None
+
+    branch, wt_status = get_repo_status(repo_str)
+    activity = _get_branch_activity(repo_str, target_date)
+
+    return RepoFetchResult.model_construct(
+        relative_path=_display_path(repo_path, config_dir),
+        absolute_path=repo_str,
+        branch=branch,
+        branch_activity=activity,
+        uncommitted=wt_status,
+        commits=commits,
+    )
 
 
 def fetch_project_commits(
@@ -183,45 +363,29 @@ def fetch_project_commits(
     timezone: str = "Europe/Oslo",
     merge_commits: bool = False,
 ) -> FetchResult:
-    """Fetch commits across all repos for a project, with branch and tree status."""
-    repo_results: list[RepoFetchResult] = []
+    """Fetch commits across all repos for a project, with branch and tree status.
 
-    for repo_path in repo_paths:
-        if not repo_path.is_dir():
-            logger.warning("Repo path does not exist, skipping: %s", repo_path)
-            continue
-
-        repo_str = str(repo_path)
-        try:
-            commits = fetch_commits(
-                repo_path=repo_str,
-                target_date=target_date,
-                user_email=user_email,
-                timezone=timezone,
-                merge_commits=merge_commits,
-                registered_hashes=registered_hashes,
-            )
-        except subprocess.CalledProcessError:
-            logger.warning("Failed to fetch commits from %s, skipping", repo_path)
-            continue
-
-        branch = get_branch_info(repo_str, target_date)
-        wt_status = get_working_tree_status(repo_str)
-
-        relative = str(repo_path.relative_to(config_dir)) if config_dir else str(repo_path)
+    Repos are processed concurrently in a thread pool since the work is dominated
+    by waiting on git subprocesses. Results keep the order of repo_paths.
+    """
+    repo_results: list[RepoFetchResult] = []
 
-        repo_results.append(
-            RepoFetchResult(
-                relative_path=relative,
-                absolute_path=repo_str,
-                branch=branch.current,
-                branch_activity=branch.activity,
-                uncommitted=wt_status,
-                commits=commits,
+    if repo_paths:
+        with ThreadPoolExecutor(max_workers=min(_MAX_GIT_WORKERS, len(repo_paths))) as pool:
+            results = pool.map(
+                lambda repo_path: _fetch_repo(
+                    repo_path,
+                    target_date,
+                    user_email,
+                    registered_hashes,
+                    config_dir,
+                    merge_commits,
+                ),
+                repo_paths,
             )
-        )
+            repo_results = [r for r in results if r is not None]
 
-    return FetchResult(
+    return FetchResult.model_construct(
         project_name=project_name,
         project_slug=project_slug,
         date=target_date,
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass, field
 from datetime import date, datetime  # noqa: TC003
 from pathlib import Path  # noqa: TC003
 from typing import Literal
 
 from pydantic import BaseModel, Field, field_validator
 
+_SLUG_RE = re.compile(r"^[a-z0-9][a-z0-9-]*$")
+
 # --- Database entities ---
 
 
@@ -28,7 +31,7 @@ class Project(BaseModel):
     @field_validator("slug")
     @classmethod
     def slug_must_be_valid(cls, v: str) -> str:
-        if not re.match(r"^[a-z0-9][a-z0-9-]*$", v):
+        if not _SLUG_RE.match(v):
             msg = "Slug must be lowercase alphanumeric with hyphens"
             raise ValueError(msg)
         return v
@@ -65,7 +68,6 @@ class Entry(BaseModel):
 class EntryCommit(BaseModel):
     """A git commit associated with a time entry."""
 
-    id: int | None = None
     entry_id: int
     commit_hash: str
     repo_path: str
@@ -81,8 +83,13 @@ class EntryCommit(BaseModel):
 # --- Git data types ---
 
 
-class CommitInfo(BaseModel):
-    """Structured commit data from git (pre-persistence)."""
+@dataclass(slots=True)
+class CommitInfo:
+    """Structured commit data from git (pre-persistence).
+
+    A slotted dataclass rather than a pydantic model: fetches can produce thousands
+    of these, and they are only built from trusted git output.
+    """
 
     hash: str
     message: str
@@ -93,7 +100,7 @@ class CommitInfo(BaseModel):
     files_changed: int = 0
     insertions: int = 0
     deletions: int = 0
-    files: list[str] = Field(default_factory=list)
+    files: list[str] = field(default_factory=list)
 
 
 class WorkingTreeStatus(BaseModel):
@@ -10,65 +10,55 @@ from typing import TYPE_CHECKING
 from timereg.core.models import Project
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from timereg.core.database import Database
     from timereg.core.models import ProjectConfig
 
+_NON_SLUG_CHARS_RE = re.compile(r"[^a-z0-9]+")
+
 
 def slugify(name: str) -> str:
     """Derive a slug from a project name: lowercase, non-alphanum replaced by hyphens."""
     slug = name.lower().strip()
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
+    slug = _NON_SLUG_CHARS_RE.sub("-", slug)
     slug = slug.strip("-")
     return slug or "project"
 
 
+# Stay under SQLite's default limit on bound parameters per statement.
+_MAX_IN_PARAMS = 900
+
 _INSERT_REPO_SQL = (
     "INSERT INTO project_repos (project_id, absolute_path, relative_path) VALUES (?, ?, ?)"
 )
 
 
+def _get_project_id(db: Database, slug: str) -> int | None:
+    """Look up just the ID of a project by slug."""
+    row = db.execute("SELECT id FROM projects WHERE slug=?", (slug,)).fetchone()
+    return row[0] if row is not None else None
+
+
 def auto_register_project(
     db: Database,
     config: ProjectConfig,
     config_path: Path,
     repo_paths: list[Path],
 ) -> Project:
-    """Register or update a project from its config file."""
-    existing = get_project(db, config.slug)
-    allowed_tags_json = json.dumps(config.allowed_tags) if config.allowed_tags else None
-    if existing is not None:
-        db.execute(
-            "UPDATE projects SET name=?, config_path=?, weekly_hours=?, monthly_hours=?, "
-            "allowed_tags=?, updated_at=datetime('now') WHERE slug=?",
-            (
-                config.name,
-                str(config_path),
-                config.weekly_budget_hours,
-                config.monthly_budget_hours,
-                allowed_tags_json,
-                config.slug,
-            ),
-        )
-        db.execute("DELETE FROM project_repos WHERE project_id=?", (existing.id,))
-        for repo_path in repo_paths:
-            db.execute(
-                _INSERT_REPO_SQL,
-                (existing.id, str(repo_path), str(repo_path.name)),
-            )
-        db.commit()
-        return Project(
-            id=existing.id,
-            name=config.name,
-            slug=config.slug,
-            config_path=str(config_path),
-            weekly_hours=config.weekly_budget_hours,
-            monthly_hours=config.monthly_budget_hours,
-            allowed_tags=config.allowed_tags,
-        )
+    """Register or update a project from its config file.
 
-    cursor = db.execute(
+    The project upsert and the repo list replacement share one transaction, so a
+    failure part way leaves the previous registration intact.
+    """
+    allowed_tags_json = json.dumps(config.allowed_tags) if config.allowed_tags else None
+    row = db.execute(
         "INSERT INTO projects (name, slug, config_path, weekly_hours, monthly_hours, allowed_tags) "
-        "VALUES (?, ?, ?, ?, ?, ?)",
+        "VALUES (?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT(slug) DO UPDATE SET name=excluded.name, config_path=excluded.config_path, "
+        "weekly_hours=excluded.weekly_hours, monthly_hours=excluded.monthly_hours, "
+        "allowed_tags=excluded.allowed_tags, updated_at=datetime('now') "
+        "RETURNING id",
         (
             config.name,
             config.slug,
@@ -77,13 +67,17 @@ def auto_register_project(
             config.monthly_budget_hours,
             allowed_tags_json,
         ),
-    )
-    project_id = cursor.lastrowid
-    for repo_path in repo_paths:
-        db.execute(
+    ).fetchone()
+    project_id = row[0]
+    try:
+        db.execute("DELETE FROM project_repos WHERE project_id=?", (project_id,))
+        db.executemany(
             _INSERT_REPO_SQL,
-            (project_id, str(repo_path), str(repo_path.name)),
+            [(project_id, str(repo_path), repo_path.name) for repo_path in repo_paths],
         )
+    except Exception:
+        db.rollback()
+        raise
     db.commit()
     return Project(
         id=project_id,
@@ -98,8 +92,7 @@ def auto_register_project(
 
 def add_project(db: Database, name: str, slug: str) -> Project:
     """Manually add a project (no config file, no repos)."""
-    existing = get_project(db, slug)
-    if existing is not None:
+    if _get_project_id(db, slug) is not None:
         msg = f"Project with slug '{slug}' already exists"
         raise ValueError(msg)
     cursor = db.execute(
@@ -110,8 +103,11 @@ def add_project(db: Database, name: str, slug: str) -> Project:
     return Project(id=cursor.lastrowid, name=name, slug=slug)
 
 
-def _row_to_project(row: tuple) -> Project:  # type: ignore[type-arg]
-    """Convert a database row to a Project model."""
+def _row_to_project(row: tuple, load_tags: bool = True) -> Project:  # type: ignore[type-arg]
+    """Convert a database row to a Project model.
+
+    With load_tags=False the JSON allowed_tags column is not decoded and is left as None.
+    """
     return Project(
         id=row[0],
         name=row[1],
@@ -119,7 +115,7 @@ def _row_to_project(row: tuple) -> Project:  # type: ignore[type-arg]
         config_path=row[3],
         weekly_hours=row[4],
         monthly_hours=row[5],
-        allowed_tags=json.loads(str(row[6])) if row[6] else None,
+        allowed_tags=json.loads(row[6]) if load_tags and row[6] else None,
         created_at=row[7],
         updated_at=row[8],
     )
@@ -171,10 +167,27 @@ def resolve_project(db: Database, identifier: str) -> Project | None:
     return None
 
 
-def list_projects(db: Database) -> list[Project]:
-    """List all registered projects."""
+def list_projects(db: Database, load_tags: bool = True) -> list[Project]:
+    """List all registered projects.
+
+    Pass load_tags=False when only names, slugs or budgets are needed; allowed_tags
+    is then left as None instead of being decoded for every row.
+    """
     rows = db.execute(f"{_SELECT_PROJECT} ORDER BY name").fetchall()
-    return [_row_to_project(r) for r in rows]
+    return [_row_to_project(r, load_tags=load_tags) for r in rows]
+
+
+def get_projects_by_ids(db: Database, ids: Iterable[int]) -> dict[int, Project]:
+    """Look up several projects by ID, returning a mapping of project_id -> Project."""
+    id_list = list(ids)
+    result: dict[int, Project] = {}
+    for start in range(0, len(id_list), _MAX_IN_PARAMS):
+        chunk = id_list[start : start + _MAX_IN_PARAMS]
+        placeholders = ", ".join("?" * len(chunk))
+        rows = db.execute(f"{_SELECT_PROJECT} WHERE id IN ({placeholders})", tuple(chunk))
+        for row in rows:
+            result[row[0]] = _row_to_project(row)
+    return result
 
 
 def get_repo_paths_by_project(db: Database, projects: list[Project]) -> dict[int, list[Path]]:
@@ -193,12 +206,12 @@ def get_repo_paths_by_project(db: Database, projects: list[Project]) -> dict[int
 
 def remove_project(db: Database, slug: str, keep_entries: bool = True) -> None:
     """Remove a project from the registry."""
-    project = get_project(db, slug)
-    if project is None:
+    project_id = _get_project_id(db, slug)
+    if project_id is None:
         msg = f"Project '{slug}' not found"
         raise ValueError(msg)
     if not keep_entries:
-        db.execute("DELETE FROM entries WHERE project_id=?", (project.id,))
-    db.execute("DELETE FROM project_repos WHERE project_id=?", (project.id,))
-    db.execute("DELETE FROM projects WHERE id=?", (project.id,))
+        db.execute("DELETE FROM entries WHERE project_id=?", (project_id,))
+    db.execute("DELETE FROM project_repos WHERE project_id=?", (project_id,))
+    db.execute("DELETE FROM projects WHERE id=?", (project_id,))
     db.commit()
@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import calendar
-from collections import defaultdict
+import functools
 from datetime import date, timedelta
+from itertools import groupby
+from operator import attrgetter, itemgetter
 from typing import TYPE_CHECKING
 
-from timereg.core.entries import list_entries
+from timereg.core.entries import list_entries_with_totals, sum_hours_by_day
 from timereg.core.models import DayDetail, ProjectSummary, SummaryReport
-from timereg.core.projects import list_projects
+from timereg.core.projects import get_projects_by_ids
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from timereg.core.database import Database
-    from timereg.core.models import Entry, Project
+    from timereg.core.models import Entry
 
 
 def _resolve_date_range(
@@ -25,9 +29,13 @@ def _resolve_date_range(
     """Resolve the date range from period + reference_date or explicit bounds."""
     if date_from is not None and date_to is not None:
         return date_from, date_to
+    # date.today() is resolved here, outside the cache, so the cache never goes stale
+    return _period_bounds(period, reference_date or date.today())
 
-    ref = reference_date or date.today()
 
+@functools.lru_cache(maxsize=256)
+def _period_bounds(period: str | None, ref: date) -> tuple[date, date]:
+    """Start and end of the period containing ref."""
     if period == "day":
         return ref, ref
     if period == "week":
@@ -42,6 +50,7 @@ def _resolve_date_range(
     return ref, ref
 
 
+@functools.lru_cache(maxsize=256)
 def _make_period_label(
     period: str | None,
     period_start: date,
@@ -75,25 +84,38 @@ def _make_period_label(
     return period_start.strftime("%b %d, %Y")
 
 
-def _filter_by_tags(entries: list[Entry], tag_filter: list[str]) -> list[Entry]:
-    """Keep only entries that have at least one matching tag."""
-    tag_set = set(tag_filter)
-    return [e for e in entries if e.tags and tag_set.intersection(e.tags)]
+_total_hours = attrgetter("total_hours")
 
+# Project attribute holding the budget for each period; other periods have no budget
+_BUDGET_ATTRS = {"week": "weekly_hours", "month": "monthly_hours"}
 
-def _build_project_lookup(db: Database) -> dict[int, Project]:
-    """Build a mapping of project_id -> Project."""
-    projects = list_projects(db)
-    return {p.id: p for p in projects if p.id is not None}
 
+def _group_entries(
+    rows: list[tuple[Entry, float, float]],
+) -> Iterator[tuple[int, list[DayDetail], float]]:
+    """Group (entry, day total, project total) rows into per-project day details.
+
+    Rows must be ordered by (project_id, date), as list_entries_with_totals returns
+    them. Totals are taken from the first row of each group rather than re-summed.
+    """
+    for pid, proj_rows in groupby(rows, key=lambda row: row[0].project_id):
+        days: list[DayDetail] = []
+        project_total = 0.0
+        for d, day_rows in groupby(proj_rows, key=lambda row: row[0].date):
+            group = list(day_rows)
+            _, day_total, project_total = group[0]
+            day_entries = [entry for entry, _, _ in group]
+            days.append(DayDetail(date=d, entries=day_entries, total_hours=day_total))
+        yield pid, days, project_total
 
-def _get_budget(project: Project, period: str | None) -> float | None:
-    """Get the relevant budget for the period."""
-    if period == "week":
-        return project.weekly_hours
-    if period == "month":
-        return project.monthly_hours
-    return None
+
+def _group_day_totals(
+    day_totals: list[tuple[int, date, float]],
+) -> Iterator[tuple[int, list[DayDetail], float]]:
+    """Group SQL per-day totals (ordered by project) into entry-less day details."""
+    for pid, rows in groupby(day_totals, key=itemgetter(0)):
+        days = [DayDetail(date=d, entries=[], total_hours=hours) for _, d, hours in rows]
+        yield pid, days, sum(map(_total_hours, days))
 
 
 def generate_summary(
@@ -115,7 +137,8 @@ def generate_summary(
         date_to: Explicit end date (inclusive).
         project_id: Filter to a single project.
         tag_filter: Include only entries with at least one matching tag.
-        detail: Detail level ("brief" or "full").
+        detail: Detail level ("brief" or "full"). Brief reports are aggregated in
+            SQL and their days carry totals only, with empty entry lists.
         reference_date: Anchor date for period calculation. Defaults to today.
 
     Returns:
@@ -128,48 +151,41 @@ def generate_summary(
         reference_date,
     )
 
-    # Query entries
-    entries = list_entries(
-        db,
-        project_id=project_id,
-        date_from=period_start,
-        date_to=period_end,
-        all_projects=(project_id is None),
-    )
-
-    # Apply tag filter in Python
-    if tag_filter:
-        entries = _filter_by_tags(entries, tag_filter)
+    all_projects = project_id is None
+    if detail == "full":
+        rows = list_entries_with_totals(
+            db,
+            project_id=project_id,
+            date_from=period_start,
+            date_to=period_end,
+            all_projects=all_projects,
+            tag_filter=tag_filter,
+        )
+        grouped = list(_group_entries(rows))
+    else:
+        day_totals = sum_hours_by_day(
+            db,
+            project_id=project_id,
+            date_from=period_start,
+            date_to=period_end,
+            all_projects=all_projects,
+            tag_filter=tag_filter,
+        )
+        grouped = list(_group_day_totals(day_totals))
 
-    # Build project lookup
-    project_lookup = _build_project_lookup(db)
+    # Look up only the projects the entries refer to
+    project_lookup = get_projects_by_ids(db, {pid for pid, _, _ in grouped})
 
-    # Group entries by project_id, then by date
-    by_project: dict[int, list[Entry]] = defaultdict(list)
-    for entry in entries:
-        by_project[entry.project_id].append(entry)
+    budget_attr = _BUDGET_ATTRS.get(period) if period else None
 
     # Build ProjectSummary for each project
     project_summaries: list[ProjectSummary] = []
-    for pid, proj_entries in sorted(by_project.items()):
+    for pid, days, total_hours in grouped:
         project = project_lookup.get(pid)
         if project is None:
             continue
 
-        # Group by date
-        by_date: dict[date, list[Entry]] = defaultdict(list)
-        for entry in proj_entries:
-            by_date[entry.date].append(entry)
-
-        days: list[DayDetail] = []
-        for d in sorted(by_date.keys()):
-            day_entries = by_date[d]
-            day_hours = sum(e.hours for e in day_entries)
-            days.append(DayDetail(date=d, entries=day_entries, total_hours=day_hours))
-
-        total_hours = sum(day.total_hours for day in days)
-
-        budget = _get_budget(project, period)
+        budget = getattr(project, budget_attr) if budget_attr else None
         budget_percent: float | None = None
         if budget is not None and budget > 0:
             budget_percent = (total_hours / budget) * 100
@@ -185,7 +201,7 @@ def generate_summary(
             )
         )
 
-    total_hours = sum(ps.total_hours for ps in project_summaries)
+    total_hours = sum(map(_total_hours, project_summaries))
 
     period_label = _make_period_label(
         period,
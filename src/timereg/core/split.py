@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import math
 from typing import NamedTuple
 
 from timereg.core.models import SuggestedSplitEntry
@@ -25,8 +24,13 @@ def round_to_nearest(hours: float, minutes: int) -> float:
     """
     if minutes <= 0:
         return hours
-    step = minutes / 60.0
-    return round(math.floor(hours / step + 0.5) * step, 4)
+    # Snap to whole minutes first (round() sends half-minutes to even), then round to the
+    # interval with integers, so a whole-minute midpoint between two steps rounds up.
+    # Minutes to hours is inexact for intervals that do not divide an hour evenly
+    # (10 min -> 0.1666...), hence the final round to 4 decimals.
+    total_minutes = round(hours * 60)
+    rounded_minutes = (total_minutes + minutes // 2) // minutes * minutes
+    return round(rounded_minutes / 60, 4)
 
 
 def calculate_split(
@@ -65,25 +69,39 @@ def calculate_split(
     )
 
     result: list[SuggestedSplitEntry] = []
-    raw_hours: list[float] = []
+    # Largest non-overridden entry, tracked while building so _fix_rounding need not scan
+    max_idx = -1
+    max_hours = -1.0
 
-    for metrics, raw_weight in zip(project_metrics, raw_weights, strict=True):
+    for i, (metrics, raw_weight) in enumerate(zip(project_metrics, raw_weights, strict=True)):
         if metrics.project_slug in overrides:
             hours = overrides[metrics.project_slug]
             weight = hours / total_hours if total_hours > 0 else 0.0
-        elif non_overridden_total_weight > 0:
-            proportion = raw_weight / non_overridden_total_weight
-            hours = proportion * remaining_hours
-            weight = hours / total_hours if total_hours > 0 else 0.0
+            suggested = round(hours, 2)
         else:
-            hours = 0.0
-            weight = 0.0
-        raw_hours.append(hours)
+            if non_overridden_total_weight > 0:
+                proportion = raw_weight / non_overridden_total_weight
+                hours = proportion * remaining_hours
+                weight = hours / total_hours if total_hours > 0 else 0.0
+            else:
+                hours = 0.0
+                weight = 0.0
+            suggested = round(hours, 2)
+            # Clamp to 0 (can go negative if overrides exceed total)
+            if suggested < 0:
+                suggested = 0.0
+                weight = 0.0
+            # Apply interval rounding (e.g. nearest 30min)
+            if rounding_minutes > 0:
+                suggested = round_to_nearest(suggested, rounding_minutes)
+            if suggested > max_hours:
+                max_idx = i
+                max_hours = suggested
         result.append(
             SuggestedSplitEntry(
                 project_slug=metrics.project_slug,
                 project_name=metrics.project_name,
-                suggested_hours=round(hours, 2),
+                suggested_hours=suggested,
                 weight=round(weight, 4),
                 commit_count=metrics.commit_count,
                 total_insertions=metrics.total_insertions,
@@ -91,37 +109,25 @@ def calculate_split(
             )
         )
 
-    # Clamp non-overridden entries to 0 (can go negative if overrides exceed total)
-    for entry in result:
-        if entry.project_slug not in overrides and entry.suggested_hours < 0:
-            entry.suggested_hours = 0.0
-            entry.weight = 0.0
-
-    # Apply interval rounding to non-overridden entries (e.g. nearest 30min)
-    if rounding_minutes > 0:
-        for entry in result:
-            if entry.project_slug not in overrides:
-                entry.suggested_hours = round_to_nearest(entry.suggested_hours, rounding_minutes)
-
     # Fix rounding so sum equals total_hours exactly
-    _fix_rounding(result, total_hours, overrides, rounding_minutes)
+    _fix_rounding(result, total_hours, overrides, rounding_minutes, hint_idx=max_idx)
 
     return result
 
 
 def _compute_raw_weights(metrics_list: list[ProjectMetrics]) -> list[float]:
     """Compute the blended weight for each project (0.5 * commit_ratio + 0.5 * lines_ratio)."""
+    lines = [m.total_insertions + m.total_deletions for m in metrics_list]
     total_commits = sum(m.commit_count for m in metrics_list)
-    total_lines = sum(m.total_insertions + m.total_deletions for m in metrics_list)
+    total_lines = sum(lines)
 
-    weights: list[float] = []
-    for m in metrics_list:
-        commit_ratio = m.commit_count / total_commits if total_commits > 0 else 0.0
-        lines = m.total_insertions + m.total_deletions
-        lines_ratio = lines / total_lines if total_lines > 0 else 0.0
-        weights.append(0.5 * commit_ratio + 0.5 * lines_ratio)
-
-    return weights
+    # Fold the 0.5 blend factor and the zero-total guards into one scale per metric
+    commit_scale = 0.5 / total_commits if total_commits > 0 else 0.0
+    lines_scale = 0.5 / total_lines if total_lines > 0 else 0.0
+    return [
+        m.commit_count * commit_scale + n * lines_scale
+        for m, n in zip(metrics_list, lines, strict=True)
+    ]
 
 
 def _fix_rounding(
@@ -129,20 +135,26 @@ def _fix_rounding(
     total_hours: float,
     overrides: dict[str, float],
     rounding_minutes: int = 0,
+    hint_idx: int = -1,
 ) -> None:
-    """Adjust the largest non-overridden entry so the sum equals total_hours exactly."""
+    """Adjust the largest non-overridden entry so the sum equals total_hours exactly.
+
+    Callers that already know the index of the largest entry pass it as hint_idx to
+    skip the scan.
+    """
     current_total = sum(e.suggested_hours for e in entries)
     remainder = round(total_hours - current_total, 2)
     if remainder == 0.0:
         return
 
     # Find the largest non-overridden entry to absorb the rounding difference
-    best_idx = -1
-    best_hours = -1.0
-    for i, entry in enumerate(entries):
-        if entry.project_slug not in overrides and entry.suggested_hours > best_hours:
-            best_hours = entry.suggested_hours
-            best_idx = i
+    best_idx = hint_idx
+    if best_idx < 0:
+        best_hours = -1.0
+        for i, entry in enumerate(entries):
+            if entry.project_slug not in overrides and entry.suggested_hours > best_hours:
+                best_hours = entry.suggested_hours
+                best_idx = i
 
     if best_idx >= 0:
         adjusted = round(entries[best_idx].suggested_hours + remainder, 2)
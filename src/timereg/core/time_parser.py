@@ -2,10 +2,31 @@
 
 from __future__ import annotations
 
-import re
 import warnings
 
-_HOURS_MINUTES_RE = re.compile(r"^(?:(\d+)h)?(?:(\d+)m)?$")
+
+def _scan_hm(value: str) -> tuple[int, int] | None:
+    """Scan an "<H>h<M>m" string (either part optional) into (hours, minutes).
+
+    Accepts exactly what the regex ^(?:(\\d+)h)?(?:(\\d+)m)?$ would: each suffix needs
+    digits before it, "h" must come before "m", and nothing may trail. Returns None
+    otherwise.
+    """
+    hours = minutes = 0
+    num: int | None = None
+    seen_h = seen_m = False
+    for ch in value:
+        if ch.isdecimal():
+            num = (num or 0) * 10 + int(ch)
+        elif ch == "h" and num is not None and not seen_h and not seen_m:
+            hours, num, seen_h = num, None, True
+        elif ch == "m" and num is not None and not seen_m:
+            minutes, num, seen_m = num, None, True
+        else:
+            return None
+    if num is not None:
+        return None
+    return hours, minutes
 
 
 def parse_time(value: str) -> float:
@@ -23,34 +44,24 @@ def parse_time(value: str) -> float:
         msg = "Time value cannot be empty"
         raise ValueError(msg)
 
-    # Try decimal format first
-    try:
-        hours = float(value)
-        if hours <= 0:
-            msg = f"Time must be positive, got {hours}"
+    # Dispatch on the unit suffix rather than trying float() and catching the failure
+    if value[-1] in "hm":
+        scanned = _scan_hm(value)
+        if scanned is None:
+            msg = f"Invalid time format: {value!r}"
             raise ValueError(msg)
-        if hours > 24:
-            warnings.warn(f"Time value {hours} exceeds 24 hours", stacklevel=2)
-        return hours
-    except ValueError:
-        if re.match(r"^-?\d*\.?\d+$", value):
-            raise
-
-    # Try hours/minutes format
-    match = _HOURS_MINUTES_RE.match(value)
-    if not match:
-        msg = f"Invalid time format: {value!r}"
-        raise ValueError(msg)
-
-    h_str, m_str = match.groups()
-    h = int(h_str) if h_str else 0
-    m = int(m_str) if m_str else 0
+        h, m = scanned
+        hours = h + m / 60
+    else:
+        try:
+            hours = float(value)
+        except ValueError:
+            msg = f"Invalid time format: {value!r}"
+            raise ValueError(msg) from None
 
-    if h == 0 and m == 0:
-        msg = "Time must be positive"
+    if hours <= 0:
+        msg = f"Time must be positive, got {hours}"
         raise ValueError(msg)
-
-    hours = h + m / 60
     if hours > 24:
         warnings.warn(f"Time value {hours} exceeds 24 hours", stacklevel=2)
     return hours
@@ -0,0 +1,28 @@
+-- Rebuild entry_commits as a WITHOUT ROWID join table keyed by (entry_id, commit_hash)
+
+CREATE TABLE entry_commits_new (
+    entry_id      INTEGER NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+    commit_hash   TEXT NOT NULL,
+    repo_path     TEXT NOT NULL,
+    message       TEXT NOT NULL,
+    author_name   TEXT NOT NULL,
+    author_email  TEXT NOT NULL,
+    timestamp     TEXT NOT NULL,
+    files_changed INTEGER DEFAULT 0,
+    insertions    INTEGER DEFAULT 0,
+    deletions     INTEGER DEFAULT 0,
+    PRIMARY KEY (entry_id, commit_hash)
+) WITHOUT ROWID;
+
+INSERT OR IGNORE INTO entry_commits_new
+    (entry_id, commit_hash, repo_path, message, author_name, author_email,
+     timestamp, files_changed, insertions, deletions)
+SELECT entry_id, commit_hash, repo_path, message, author_name, author_email,
+       timestamp, files_changed, insertions, deletions
+FROM entry_commits ORDER BY id;
+
+DROP TABLE entry_commits;
+
+ALTER TABLE entry_commits_new RENAME TO entry_commits;
+
+CREATE INDEX idx_entry_commits_hash ON entry_commits(commit_hash);
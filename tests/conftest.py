@@ -2,51 +2,325 @@
 
 from __future__ import annotations
 
+import io
+import json
 import os
+import shutil
 import subprocess
-from typing import TYPE_CHECKING
+import sys
+import uuid
+from contextlib import redirect_stdout
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import pytest
+import typer.main
+from typer.core import TyperGroup
+from typer.testing import CliRunner, Result
 
+from timereg.cli.app import app, state
+from timereg.cli.register import register
 from timereg.core.database import Database
+from timereg.core.git import _is_repo_dir
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Mapping, Sequence
     from pathlib import Path
 
 
+_SLOW_TEST_DIRS = frozenset({"integration", "e2e"})
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Mark everything under tests/integration and tests/e2e as slow."""
+    for item in items:
+        if item.path.parent.name in _SLOW_TEST_DIRS:
+            item.add_marker(pytest.mark.slow)
+
+
+@pytest.fixture(scope="session")
+def _session_home(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("home")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_home(_session_home: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point HOME away from the real home, at one directory shared by the whole session.
+
+    The CLI creates its global config under the user's config dir, and falls back to a
+    database under the data dir. Tests do share this HOME (one per worker under xdist),
+    which is safe only because the CLI writes the same default config on every run and
+    every CLI test passes --db-path. Tests that need a HOME of their own use fresh_home.
+    """
+    monkeypatch.setenv("HOME", str(_session_home))
+    for var in ("XDG_CONFIG_HOME", "XDG_DATA_HOME", "TIMEREG_DB_PATH", "TIMEREG_PROJECT_CONFIG"):
+        monkeypatch.delenv(var, raising=False)
+
+
 @pytest.fixture()
-def tmp_db(tmp_path: Path) -> Generator[Database, None, None]:
-    """Fresh SQLite database with migrations applied."""
-    db = Database(tmp_path / "test.db")
+def fresh_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Give the test an empty HOME of its own, so global config it writes stays private."""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    return home
+
+
+@pytest.fixture(autouse=True)
+def _reset_app_state() -> Generator[None, None, None]:
+    """Restore the CLI's module-level state after each test, so no test sees another's db."""
+    saved = vars(state).copy()
+    yield
+    vars(state).clear()
+    vars(state).update(saved)
+
+
+@pytest.fixture(autouse=True)
+def _clear_repo_dir_cache() -> Generator[None, None, None]:
+    """Forget cached repo is_dir() results, which otherwise outlive the test that made them."""
+    yield
+    _is_repo_dir.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def click_app() -> TyperGroup:
+    """The app's Click command tree, built once per session for ClickRunner."""
+    command = typer.main.get_command(app)
+    assert isinstance(command, TyperGroup)
+    return command
+
+
+class ClickRunner(CliRunner):
+    """CliRunner that invokes an already built Click command.
+
+    typer's CliRunner.invoke takes the Typer app and rebuilds every command, parameter
+    and help text from it on each call (~17ms for this app); this one is given the
+    click_app fixture instead, and otherwise captures output and exit codes the same way.
+    """
+
+    def invoke(  # type: ignore[override]
+        self,
+        cli: TyperGroup,
+        args: Sequence[str] = (),
+        input: str | None = None,
+        env: Mapping[str, str | None] | None = None,
+        catch_exceptions: bool = True,
+    ) -> Result:
+        exception: BaseException | None = None
+        exc_info: Any = None
+        exit_code = 0
+        with self.isolation(input=input, env=env) as (stdout, stderr, output):
+            try:
+                cli.main(args=list(args), prog_name=self.get_default_prog_name(cli))
+            except SystemExit as e:
+                code = 0 if e.code is None else e.code
+                if not isinstance(code, int):
+                    sys.stdout.write(f"{code}\n")
+                    code = 1
+                if code != 0:
+                    exception = e
+                    exc_info = sys.exc_info()
+                exit_code = code
+            except Exception as e:
+                if not catch_exceptions:
+                    raise
+                exception = e
+                exit_code = 1
+                exc_info = sys.exc_info()
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                stdout_bytes = stdout.getvalue()
+                stderr_bytes = stderr.getvalue()
+                output_bytes = output.getvalue()
+        return Result(
+            runner=self,
+            stdout_bytes=stdout_bytes,
+            stderr_bytes=stderr_bytes,
+            output_bytes=output_bytes,
+            return_value=None,
+            exit_code=exit_code,
+            exception=exception,
+            exc_info=exc_info,
+        )
+
+
+@pytest.fixture(scope="session")
+def migrated_db_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Database file with all migrations applied, built once per test session."""
+    path = tmp_path_factory.mktemp("db-template") / "template.db"
+    db = Database(path)
+    db.execute("PRAGMA synchronous=OFF")
     db.migrate()
-    yield db
     db.close()
+    return path
 
 
 @pytest.fixture()
-def git_repo(tmp_path: Path) -> Path:
-    """Initialize a git repo with a configured user and initial commit."""
-    repo = tmp_path / "repo"
+def db_path(migrated_db_template: Path) -> Generator[str, None, None]:
+    """URI of a fresh migrated in-memory database, for tests that drive the CLI via --db-path.
+
+    The database uses SQLite's shared cache, so every connection the CLI opens in this
+    process sees the same data; the fixture holds one connection to keep it alive.
+    """
+    uri = f"file:test_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    db = Database(uri)
+    db.load(migrated_db_template)
+    yield uri
+    db.close()
+
+
+@pytest.fixture()
+def tmp_db(tmp_path: Path, migrated_db_template: Path) -> Generator[Database, None, None]:
+    """Fresh SQLite database with migrations applied, copied from the session template."""
+    db_path = tmp_path / "test.db"
+    shutil.copyfile(migrated_db_template, db_path)
+    db = Database(db_path)
+    # Throwaway database: skip the fsyncs that protect committed data against power loss
+    db.execute("PRAGMA synchronous=OFF")
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="session")
+def today() -> date:
+    """The session's current date, taken once so every test agrees on it."""
+    return date.today()
+
+
+@pytest.fixture(scope="session")
+def today_iso(today: date) -> str:
+    """The session's current date as YYYY-MM-DD, for --date arguments."""
+    return today.isoformat()
+
+
+@pytest.fixture(scope="session")
+def git_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Git repo with a configured user and initial commit, built once per test session."""
+    repo = tmp_path_factory.mktemp("git-template") / "repo"
     repo.mkdir()
-    subprocess.run(["git", "init"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"], cwd=repo, check=True, capture_output=True
-    )
+    (repo / "README.md").write_text("# Test Project\n")
+    # One shell instead of five git processes spawned from Python
     subprocess.run(
-        ["git", "config", "user.email", "test@example.com"],
+        [
+            "sh",
+            "-c",
+            "git init -q"
+            " && git config user.name 'Test User'"
+            " && git config user.email test@example.com"
+            " && git add ."
+            " && git commit -q -m 'initial commit'",
+        ],
         cwd=repo,
         check=True,
         capture_output=True,
     )
-    (repo / "README.md").write_text("# Test Project\n")
-    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "initial commit"], cwd=repo, check=True, capture_output=True
-    )
     return repo
 
 
+@pytest.fixture()
+def git_repo(tmp_path: Path, git_repo_template: Path) -> Path:
+    """Git repo with a configured user and initial commit, copied from the session template."""
+    repo = tmp_path / "repo"
+    shutil.copytree(git_repo_template, repo, symlinks=True)
+    return repo
+
+
+class CliContext(NamedTuple):
+    """A project selected via TIMEREG_PROJECT_CONFIG, with a migrated database."""
+
+    db_path: str
+    today: str
+    app: TyperGroup
+
+
+@pytest.fixture()
+def ctx(
+    tmp_path: Path,
+    db_path: str,
+    today_iso: str,
+    click_app: TyperGroup,
+    monkeypatch: pytest.MonkeyPatch,
+) -> CliContext:
+    """Everything a CLI test needs to run commands against a "test" project.
+
+    The project directory is not a git repository: none of these commands read history,
+    and the git user they resolve comes from a global git config file instead.
+    """
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    config = project_dir / ".timereg.toml"
+    config.write_text('[project]\nname = "Test"\nslug = "test"\n')
+    gitconfig = tmp_path / "gitconfig"
+    gitconfig.write_text("[user]\n\tname = Test User\n\temail = test@example.com\n")
+    # Set in os.environ rather than the runner env: register_entry runs in-process
+    monkeypatch.setenv("TIMEREG_PROJECT_CONFIG", str(config))
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(gitconfig))
+    return CliContext(db_path, today_iso, click_app)
+
+
+_runner = ClickRunner()
+
+
+def invoke(ctx: CliContext, *args: str, input: str | None = None) -> Result:
+    """Run the CLI against the context's database."""
+    return _runner.invoke(
+        ctx.app,
+        ["--db-path", ctx.db_path, *args],
+        input=input,
+        catch_exceptions=False,
+    )
+
+
+def invoke_json(ctx: CliContext, *args: str) -> Any:
+    """Run a command with --format json, assert it succeeded and return the parsed output."""
+    result = invoke(ctx, "--format", "json", *args)
+    assert result.exit_code == 0, result.stdout
+    return json.loads(result.stdout_bytes)
+
+
+def register_entry(
+    ctx: CliContext,
+    hours: str = "2",
+    short_summary: str = "Test entry",
+    date_str: str | None = None,
+) -> dict[str, Any]:
+    """Register an entry (today by default) and return the JSON response.
+
+    Calls the register command function in-process rather than through the runner;
+    registering is only setup here and is covered end to end by test_cli_register.
+    """
+    state.db = Database(ctx.db_path)
+    state.output_format = "json"
+    out = io.StringIO()
+    try:
+        with redirect_stdout(out):
+            register(hours=hours, short_summary=short_summary, date_str=date_str or ctx.today)
+    finally:
+        state.db.close()
+    result: dict[str, Any] = json.loads(out.getvalue())
+    return result
+
+
+def seed_projects(db_path: str | Path, projects: list[tuple[str, str]]) -> None:
+    """Insert (name, slug) projects in one batch, migrating the database first."""
+    with Database(db_path) as db:
+        db.migrate()
+        db.executemany("INSERT INTO projects (name, slug) VALUES (?, ?)", projects)
+        db.commit()
+
+
+def seed_entries(db: Database, entries: list[tuple[int, str, float, str]]) -> None:
+    """Insert manual (project_id, date, hours, short_summary) entries in one batch."""
+    db.executemany(
+        "INSERT INTO entries"
+        " (project_id, date, hours, short_summary, git_user_name, git_user_email, entry_type)"
+        " VALUES (?, ?, ?, ?, 'Test', 'test@test.com', 'manual')",
+        entries,
+    )
+    db.commit()
+
+
 def make_commit(
     repo: Path,
     filename: str,
@@ -56,24 +330,91 @@ def make_commit(
 ) -> str:
     """Create a file and commit it. Returns the commit hash."""
     (repo / filename).write_text(content)
-    subprocess.run(["git", "add", filename], cwd=repo, check=True, capture_output=True)
     env = os.environ.copy()
     if commit_date:
         env["GIT_AUTHOR_DATE"] = commit_date
         env["GIT_COMMITTER_DATE"] = commit_date
+    # Filename and message are passed as positional parameters, so no shell quoting
     subprocess.run(
-        ["git", "commit", "-m", message],
+        ["sh", "-c", 'git add -- "$1" && git commit -q -m "$2"', "sh", filename, message],
         cwd=repo,
         check=True,
         capture_output=True,
-        text=True,
         env=env,
     )
-    hash_result = subprocess.run(
-        ["git", "rev-parse", "HEAD"],
+    return head_hash(repo)
+
+
+class CommitSpec(NamedTuple):
+    """One commit for make_commits: a single file written with content."""
+
+    filename: str
+    content: str
+    message: str
+    commit_date: str | None = None
+
+
+def make_commits(
+    repo: Path,
+    commits: list[CommitSpec],
+    author: str = "Test User <test@example.com>",
+) -> list[str]:
+    """Create several commits on the current branch with one `git fast-import` stream.
+
+    Returns the commit hashes in order. The index and working tree are reset to the new
+    HEAD afterwards, so the repo looks as if the commits were made one by one.
+    """
+    ref = (repo / ".git" / "HEAD").read_text().strip().removeprefix("ref: ")
+    stream = bytearray()
+    for mark, spec in enumerate(commits, start=1):
+        when = datetime.fromisoformat(spec.commit_date) if spec.commit_date else datetime.now()
+        when = when.astimezone() if when.tzinfo is None else when
+        stamp = f"{author} {int(when.timestamp())} {when.strftime('%z')}"
+        content = spec.content.encode()
+        message = spec.message.encode()
+        stream += f"commit {ref}\nmark :{mark}\n".encode()
+        stream += f"author {stamp}\ncommitter {stamp}\n".encode()
+        stream += b"data %d\n%s\n" % (len(message), message)
+        if mark == 1:
+            stream += f"from {ref}^0\n".encode()
+        stream += f"M 100644 inline {spec.filename}\n".encode()
+        stream += b"data %d\n%s\n" % (len(content), content)
+    marks = repo / ".git" / "fast-import-marks"
+    subprocess.run(
+        [
+            "sh",
+            "-c",
+            'git fast-import --quiet --export-marks="$1" && git reset -q --hard',
+            "sh",
+            marks,
+        ],
         cwd=repo,
+        input=bytes(stream),
         check=True,
         capture_output=True,
-        text=True,
     )
-    return hash_result.stdout.strip()
+    hashes = dict(line.split() for line in marks.read_text().splitlines())
+    marks.unlink()
+    return [hashes[f":{mark}"] for mark in range(1, len(commits) + 1)]
+
+
+def fetched_hashes(fetch_data: dict[str, Any]) -> set[str]:
+    """Return the hashes of every commit in a `fetch --format json` payload."""
+    return {c["hash"] for repo in fetch_data["repos"] for c in repo["commits"]}
+
+
+def head_hash(repo: Path) -> str:
+    """Return the commit hash HEAD points to, read from .git without spawning git.
+
+    Falls back to `git rev-parse` when the branch ref is not a loose file (packed refs).
+    """
+    git_dir = repo / ".git"
+    head = (git_dir / "HEAD").read_text().strip()
+    if not head.startswith("ref: "):
+        return head
+    ref_file = git_dir / head.removeprefix("ref: ")
+    if ref_file.is_file():
+        return ref_file.read_text().strip()
+    # A hex hash needs no locale-aware text decoding
+    result = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, check=True, capture_output=True)
+    return result.stdout.decode("ascii").strip()
@@ -8,42 +8,128 @@ Also covers Phase 2 features: summary, status, check, export, and tag constraint
 
 from __future__ import annotations
 
-import csv
-import io
 import json
+import os
 import subprocess
-from datetime import date
-from typing import TYPE_CHECKING
-
-from typer.testing import CliRunner
-
-from tests.conftest import make_commit
-from timereg.cli.app import app
+from typing import TYPE_CHECKING, NamedTuple
+
+import pytest
+
+from tests.conftest import (
+    ClickRunner,
+    CommitSpec,
+    fetched_hashes,
+    head_hash,
+    make_commit,
+    make_commits,
+)
+from timereg.core.config import load_project_config
+from timereg.core.database import Database
+from timereg.core.entries import (
+    create_entry,
+    get_registered_commit_hashes,
+    list_entries,
+    undo_last,
+)
+from timereg.core.git import fetch_commit_hashes, fetch_project_commits, resolve_git_user
+from timereg.core.models import CommitInfo
+from timereg.core.projects import auto_register_project, get_project
+from timereg.core.time_parser import parse_time
 
 if TYPE_CHECKING:
+    from datetime import date
     from pathlib import Path
 
-    import pytest
-
-runner = CliRunner()
+    from typer.core import TyperGroup
+
+    from timereg.core.models import Entry
+
+
+class _Cli(NamedTuple):
+    """ClickRunner, and the database path to pass it."""
+
+    runner: ClickRunner
+    db_path: str
+
+
+@pytest.fixture()
+def cli(tmp_path: Path) -> _Cli:
+    """Runner and a throwaway database path; HOME is isolated by the autouse fixture."""
+    return _Cli(ClickRunner(), str(tmp_path / "test.db"))
+
+
+def _fetch_hashes(db: Database, config_path: Path, target_date: str) -> list[str]:
+    """Fetch unregistered commit hashes for the project configured at config_path."""
+    project_config = load_project_config(config_path)
+    repo_paths = project_config.resolve_repo_paths(config_path.parent)
+    project = auto_register_project(db, project_config, config_path, repo_paths)
+    assert project.id is not None
+    user = resolve_git_user(str(repo_paths[0]))
+    result = fetch_project_commits(
+        repo_paths=repo_paths,
+        target_date=target_date,
+        user_email=user.email,
+        registered_hashes=get_registered_commit_hashes(db, project.id),
+        user=user,
+        project_name=project.name,
+        project_slug=project.slug,
+        config_dir=config_path.parent,
+    )
+    return [c.hash for repo in result.repos for c in repo.commits]
+
+
+def _unregistered(db: Database, repo: Path, project_id: int, target_date: str) -> set[str]:
+    """Hashes of today's commits in repo not yet registered to the project."""
+    hashes = fetch_commit_hashes(repo, target_date, "test@example.com")
+    return hashes - get_registered_commit_hashes(db, project_id)
+
+
+def _register(
+    db: Database, project_id: int, entry_date: date, hours: str, summary: str, hashes: list[str]
+) -> Entry:
+    """Register one git entry on entry_date claiming the given commit hashes."""
+    entry = create_entry(
+        db=db,
+        project_id=project_id,
+        hours=parse_time(hours),
+        short_summary=summary,
+        entry_date=entry_date,
+        git_user_name="Test User",
+        git_user_email="test@example.com",
+        entry_type="git",
+        commits=[
+            CommitInfo(
+                hash=h,
+                message="",
+                author_name="Test User",
+                author_email="test@example.com",
+                timestamp=entry_date.isoformat(),
+                repo_path="",
+            )
+            for h in hashes
+        ],
+    )
+    assert not isinstance(entry, list)
+    return entry
 
 
 class TestFullRegistrationWorkflow:
     """Complete workflow: init repo -> commits -> fetch -> register -> list -> undo."""
 
-    def test_full_workflow(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_full_workflow(self, git_repo: Path, tmp_db: Database, today: date) -> None:
         """End-to-end test covering the complete time registration lifecycle.
 
+        Runs against the core functions the CLI commands are built on; the CLI surface
+        itself is covered by test_full_workflow_cli_smoke.
+
         Steps:
         1. Set up git repo with .timereg.toml
         2. Make 3 commits
         3. Fetch — verify 3 unregistered commits
         4. Register 2 commits as one entry
-        5. Fetch — verify 1 unregistered commit remains
+        5. Hashes only — verify 1 unregistered commit remains
         6. Register the remaining commit
-        7. Fetch — verify 0 unregistered commits
+        7. Hashes only — verify 0 unregistered commits
         8. List — verify 2 entries with correct total hours
         9. Undo — remove last entry
         10. List — verify 1 entry remains
@@ -51,203 +137,158 @@ class TestFullRegistrationWorkflow:
         # -- Setup --
         config = git_repo / ".timereg.toml"
         config.write_text('[project]\nname = "Test Project"\nslug = "test-project"\n')
-
-        monkeypatch.chdir(git_repo)
-        db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
+        today_iso = today.isoformat()
 
         # Capture the initial commit hash created by the git_repo fixture.
         # It was made today so fetch will include it.
-        initial_hash = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=git_repo,
-            check=True,
-            capture_output=True,
-            text=True,
-        ).stdout.strip()
+        initial_hash = head_hash(git_repo)
 
         # -- Step 2: Make 3 commits --
-        hash1 = make_commit(
-            git_repo,
-            "feature_a.py",
-            "def feature_a(): pass\n",
-            "feat: add feature A",
-            commit_date=f"{today}T09:00:00+01:00",
-        )
-        hash2 = make_commit(
+        hash1, hash2, hash3 = make_commits(
             git_repo,
-            "feature_b.py",
-            "def feature_b(): pass\n",
-            "feat: add feature B",
-            commit_date=f"{today}T10:30:00+01:00",
-        )
-        hash3 = make_commit(
-            git_repo,
-            "feature_c.py",
-            "def feature_c(): pass\n",
-            "fix: bug in feature C",
-            commit_date=f"{today}T14:00:00+01:00",
+            [
+                CommitSpec(
+                    "feature_a.py",
+                    "def feature_a(): pass\n",
+                    "feat: add feature A",
+                    commit_date=f"{today_iso}T09:00:00+01:00",
+                ),
+                CommitSpec(
+                    "feature_b.py",
+                    "def feature_b(): pass\n",
+                    "feat: add feature B",
+                    commit_date=f"{today_iso}T10:30:00+01:00",
+                ),
+                CommitSpec(
+                    "feature_c.py",
+                    "def feature_c(): pass\n",
+                    "fix: bug in feature C",
+                    commit_date=f"{today_iso}T14:00:00+01:00",
+                ),
+            ],
         )
 
         # -- Step 3: Fetch — all commits should be unregistered --
         # The git_repo fixture creates an initial commit (today), so we
         # expect 4 total: initial + 3 feature commits.
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "--format", "json", "fetch", "--date", today],
-            catch_exceptions=False,
-            env=env,
-        )
-        assert result.exit_code == 0
-        fetch_data = json.loads(result.stdout)
-        all_commits = []
-        for repo in fetch_data["repos"]:
-            all_commits.extend(repo["commits"])
-        commit_hashes = [c["hash"] for c in all_commits]
-        assert len(commit_hashes) == 4
-        assert initial_hash in commit_hashes
-        assert hash1 in commit_hashes
-        assert hash2 in commit_hashes
-        assert hash3 in commit_hashes
+        commit_hashes = _fetch_hashes(tmp_db, config, today_iso)
+        assert sorted(commit_hashes) == sorted([initial_hash, hash1, hash2, hash3])
+
+        project = get_project(tmp_db, "test-project")
+        assert project is not None
+        assert project.id is not None
 
         # -- Step 4: Register entry #1 with 3 commits (initial, hash1, hash2) --
-        result = runner.invoke(
-            app,
-            [
-                "--db-path",
-                db_path,
-                "--format",
-                "json",
-                "register",
-                "--hours",
-                "3h30m",
-                "--short-summary",
-                "Feature A and B implementation",
-                "--long-summary",
-                "Implemented feature A and feature B including initial scaffolding and core logic.",
-                "--commits",
-                f"{initial_hash},{hash1},{hash2}",
-                "--date",
-                today,
-            ],
-            catch_exceptions=False,
-            env=env,
+        entry1 = _register(
+            tmp_db,
+            project.id,
+            today,
+            "3h30m",
+            "Feature A and B implementation",
+            [initial_hash, hash1, hash2],
         )
-        assert result.exit_code == 0
-        entry1 = json.loads(result.stdout)
-        assert entry1["hours"] == 3.5
-        assert entry1["short_summary"] == "Feature A and B implementation"
-        assert entry1["entry_type"] == "git"
-        entry1_id = entry1["id"]
+        assert entry1.hours == 3.5
+        assert entry1.entry_type == "git"
 
-        # -- Step 5: Fetch again — only 1 unregistered commit should remain --
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "--format", "json", "fetch", "--date", today],
-            catch_exceptions=False,
-            env=env,
-        )
-        assert result.exit_code == 0
-        fetch_data = json.loads(result.stdout)
-        remaining_commits = []
-        for repo in fetch_data["repos"]:
-            remaining_commits.extend(repo["commits"])
-        remaining_hashes = [c["hash"] for c in remaining_commits]
-        assert len(remaining_hashes) == 1
-        assert hash3 in remaining_hashes
-        assert hash1 not in remaining_hashes
-        assert hash2 not in remaining_hashes
-        assert initial_hash not in remaining_hashes
+        # -- Step 5: Only 1 unregistered commit should remain --
+        assert _unregistered(tmp_db, git_repo, project.id, today_iso) == {hash3}
 
         # -- Step 6: Register entry #2 with the remaining commit --
-        result = runner.invoke(
-            app,
-            [
-                "--db-path",
-                db_path,
-                "--format",
-                "json",
-                "register",
-                "--hours",
-                "1h30m",
-                "--short-summary",
-                "Bug fix in feature C",
-                "--commits",
-                hash3,
-                "--date",
-                today,
-            ],
-            catch_exceptions=False,
-            env=env,
-        )
-        assert result.exit_code == 0
-        entry2 = json.loads(result.stdout)
-        assert entry2["hours"] == 1.5
-        assert entry2["short_summary"] == "Bug fix in feature C"
-        entry2_id = entry2["id"]
+        entry2 = _register(tmp_db, project.id, today, "1h30m", "Bug fix in feature C", [hash3])
+        assert entry2.hours == 1.5
 
-        # -- Step 7: Fetch again — 0 unregistered commits --
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "--format", "json", "fetch", "--date", today],
-            catch_exceptions=False,
-            env=env,
-        )
-        assert result.exit_code == 0
-        fetch_data = json.loads(result.stdout)
-        final_commits = []
-        for repo in fetch_data["repos"]:
-            final_commits.extend(repo["commits"])
-        assert len(final_commits) == 0
+        # -- Step 7: 0 unregistered commits --
+        assert _unregistered(tmp_db, git_repo, project.id, today_iso) == set()
 
         # -- Step 8: List — verify 2 entries with correct total hours --
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "--format", "json", "list", "--date", today],
-            catch_exceptions=False,
-            env=env,
-        )
-        assert result.exit_code == 0
-        entries = json.loads(result.stdout)
+        entries = list_entries(tmp_db, project_id=project.id, date_filter=today)
         assert len(entries) == 2
-        total_hours = sum(e["hours"] for e in entries)
-        assert total_hours == 5.0  # 3.5 + 1.5
-        summaries = [e["short_summary"] for e in entries]
-        assert "Feature A and B implementation" in summaries
-        assert "Bug fix in feature C" in summaries
+        assert sum(e.hours for e in entries) == 5.0  # 3.5 + 1.5
+        assert {e.short_summary for e in entries} == {
+            "Feature A and B implementation",
+            "Bug fix in feature C",
+        }
 
         # -- Step 9: Undo — removes the last entry (entry #2) --
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "--format", "json", "undo"],
-            catch_exceptions=False,
-            env=env,
-        )
-        assert result.exit_code == 0
-        undo_data = json.loads(result.stdout)
-        assert undo_data["undone"]["id"] == entry2_id
+        undone = undo_last(tmp_db, "test@example.com")
+        assert undone is not None
+        assert undone.id == entry2.id
 
         # -- Step 10: Verify only 1 entry remains --
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "--format", "json", "list", "--date", today],
-            catch_exceptions=False,
-            env=env,
+        entries = list_entries(tmp_db, project_id=project.id, date_filter=today)
+        assert [e.id for e in entries] == [entry1.id]
+
+    def test_full_workflow_cli_smoke(
+        self,
+        click_app: TyperGroup,
+        git_repo: Path,
+        cli: _Cli,
+        today: date,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Fetch, register, list and undo through the Typer app."""
+        config = git_repo / ".timereg.toml"
+        config.write_text('[project]\nname = "Test Project"\nslug = "test-project"\n')
+
+        monkeypatch.chdir(git_repo)
+        runner, db_path = cli
+        today_iso = today.isoformat()
+        commit_hash = make_commit(
+            git_repo,
+            "feature_a.py",
+            "def feature_a(): pass\n",
+            "feat: add feature A",
+            commit_date=f"{today_iso}T09:00:00+01:00",
         )
-        assert result.exit_code == 0
-        entries = json.loads(result.stdout)
-        assert len(entries) == 1
-        assert entries[0]["id"] == entry1_id
-        assert entries[0]["hours"] == 3.5
-        assert entries[0]["short_summary"] == "Feature A and B implementation"
+
+        def invoke(*args: str) -> object:
+            result = runner.invoke(
+                click_app,
+                ["--db-path", db_path, "--format", "json", *args],
+                catch_exceptions=False,
+            )
+            assert result.exit_code == 0
+            return json.loads(result.stdout_bytes)
+
+        fetch_data = invoke("fetch", "--date", today_iso)
+        assert isinstance(fetch_data, dict)
+        fetched = fetched_hashes(fetch_data)
+        assert commit_hash in fetched
+
+        entry = invoke(
+            "register",
+            "--hours",
+            "3h30m",
+            "--short-summary",
+            "Feature A",
+            "--commits",
+            ",".join(fetched),
+            "--date",
+            today_iso,
+        )
+        assert isinstance(entry, dict)
+        assert entry["hours"] == 3.5
+
+        db = Database(db_path)
+        try:
+            assert _unregistered(db, git_repo, entry["project_id"], today_iso) == set()
+        finally:
+            db.close()
+
+        entries = invoke("list", "--date", today_iso)
+        assert isinstance(entries, list)
+        assert [e["id"] for e in entries] == [entry["id"]]
+
+        undo_data = invoke("undo")
+        assert isinstance(undo_data, dict)
+        assert undo_data["undone"]["id"] == entry["id"]
 
 
 class TestPhase2Workflow:
     """E2E test covering Phase 2 features: summary, status, check, export, tag constraints."""
 
     def test_phase2_workflow(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, click_app: TyperGroup, git_repo: Path, cli: _Cli, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """End-to-end test covering Phase 2 reporting, budget, and export features.
 
@@ -279,44 +320,46 @@ class TestPhase2Workflow:
         )
 
         monkeypatch.chdir(git_repo)
-        db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
-
-        # Capture the initial commit hash created by the git_repo fixture.
-        initial_hash = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
+        runner, db_path = cli
+        # A fixed Wednesday, so check --day always evaluates the day instead of skipping
+        # it on weekends. The fixture's initial commit is re-dated to it.
+        work_day = "2026-02-25"
+        subprocess.run(
+            ["git", "commit", "--amend", "-q", "--no-edit", f"--date={work_day}T08:00:00+01:00"],
             cwd=git_repo,
             check=True,
             capture_output=True,
-            text=True,
-        ).stdout.strip()
+            env={**os.environ, "GIT_COMMITTER_DATE": f"{work_day}T08:00:00+01:00"},
+        )
+        initial_hash = head_hash(git_repo)
 
         # -- Step 2: Make 2 commits --
-        hash1 = make_commit(
-            git_repo,
-            "feature_x.py",
-            "def feature_x(): pass\n",
-            "feat: add feature X",
-            commit_date=f"{today}T09:00:00+01:00",
-        )
-        hash2 = make_commit(
+        hash1, hash2 = make_commits(
             git_repo,
-            "feature_y.py",
-            "def feature_y(): pass\n",
-            "feat: add feature Y",
-            commit_date=f"{today}T11:00:00+01:00",
+            [
+                CommitSpec(
+                    "feature_x.py",
+                    "def feature_x(): pass\n",
+                    "feat: add feature X",
+                    commit_date=f"{work_day}T09:00:00+01:00",
+                ),
+                CommitSpec(
+                    "feature_y.py",
+                    "def feature_y(): pass\n",
+                    "feat: add feature Y",
+                    commit_date=f"{work_day}T11:00:00+01:00",
+                ),
+            ],
         )
 
         # -- Step 3: Fetch — verify multi-repo output with branch info --
         result = runner.invoke(
-            app,
-            ["--db-path", db_path, "--format", "json", "fetch", "--date", today],
+            click_app,
+            ["--db-path", db_path, "--format", "json", "fetch", "--date", work_day],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
-        fetch_data = json.loads(result.stdout)
+        fetch_data = json.loads(result.stdout_bytes)
         # Verify repos have branch info
         assert len(fetch_data["repos"]) >= 1
         repo_data = fetch_data["repos"][0]
@@ -324,18 +367,11 @@ class TestPhase2Workflow:
         assert isinstance(repo_data["branch"], str)
         assert len(repo_data["branch"]) > 0
         # Verify commits exist (initial + 2 feature commits = 3)
-        all_commits = []
-        for repo in fetch_data["repos"]:
-            all_commits.extend(repo["commits"])
-        assert len(all_commits) == 3
-        all_hashes = [c["hash"] for c in all_commits]
-        assert initial_hash in all_hashes
-        assert hash1 in all_hashes
-        assert hash2 in all_hashes
+        assert fetched_hashes(fetch_data) == {initial_hash, hash1, hash2}
 
         # -- Step 4: Register entry with valid tags --
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -353,20 +389,19 @@ class TestPhase2Workflow:
                 "--commits",
                 f"{initial_hash},{hash1},{hash2}",
                 "--date",
-                today,
+                work_day,
             ],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
-        entry_data = json.loads(result.stdout)
+        entry_data = json.loads(result.stdout_bytes)
         assert entry_data["hours"] == 3.5
         assert entry_data["short_summary"] == "Feature work"
         assert entry_data["tags"] == ["development", "review"]
 
         # -- Step 5: Try to register with invalid tag — error --
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -382,17 +417,16 @@ class TestPhase2Workflow:
                 "--entry-type",
                 "manual",
                 "--date",
-                today,
+                work_day,
             ],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code != 0
         assert "invalid" in result.stdout.lower() or "invalid" in (result.stderr or "").lower()
 
         # -- Step 6: Summary --week — verify budget percentage --
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -401,13 +435,12 @@ class TestPhase2Workflow:
                 "summary",
                 "--week",
                 "--date",
-                today,
+                work_day,
             ],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
-        summary_data = json.loads(result.stdout)
+        summary_data = json.loads(result.stdout_bytes)
         assert summary_data["total_hours"] == 3.5
         assert len(summary_data["projects"]) == 1
         project_summary = summary_data["projects"][0]
@@ -419,7 +452,7 @@ class TestPhase2Workflow:
 
         # -- Step 7: Status — verify hours and entry count --
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -427,13 +460,12 @@ class TestPhase2Workflow:
                 "json",
                 "status",
                 "--date",
-                today,
+                work_day,
             ],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
-        status_data = json.loads(result.stdout)
+        status_data = json.loads(result.stdout_bytes)
         assert len(status_data["projects"]) == 1
         project_status = status_data["projects"][0]
         assert project_status["today_hours"] == 3.5
@@ -441,7 +473,7 @@ class TestPhase2Workflow:
 
         # -- Step 8: Check --day — verify no warnings for covered day --
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -450,28 +482,20 @@ class TestPhase2Workflow:
                 "check",
                 "--day",
                 "--date",
-                today,
+                work_day,
             ],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
-        check_data = json.loads(result.stdout)
-        # check --day skips weekends; only verify if today is a weekday
-        today_date = date.today()
-        if today_date.weekday() < 5:
-            # Weekday: should have exactly one day entry with ok=True
-            assert len(check_data["days"]) == 1
-            day_check = check_data["days"][0]
-            assert day_check["total_hours"] == 3.5
-            assert day_check["ok"] is True
-        else:
-            # Weekend: check skips the day entirely
-            assert len(check_data["days"]) == 0
+        check_data = json.loads(result.stdout_bytes)
+        assert len(check_data["days"]) == 1
+        day_check = check_data["days"][0]
+        assert day_check["total_hours"] == 3.5
+        assert day_check["ok"] is True
 
         # -- Step 9: Export CSV — verify format --
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -480,12 +504,10 @@ class TestPhase2Workflow:
                 "csv",
             ],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
-        csv_output = result.stdout
-        reader = csv.reader(io.StringIO(csv_output))
-        rows = list(reader)
+        # No field written above contains a comma or quote, so the rows split plainly
+        rows = [line.split(",") for line in result.stdout.splitlines()]
         # Header + 1 data row
         assert len(rows) == 2
         header = rows[0]
@@ -502,7 +524,7 @@ class TestPhase2Workflow:
 
         # -- Step 10: Export JSON — verify structure --
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -511,10 +533,9 @@ class TestPhase2Workflow:
                 "json",
             ],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
-        export_data = json.loads(result.stdout)
+        export_data = json.loads(result.stdout_bytes)
         assert isinstance(export_data, list)
         assert len(export_data) == 1
         entry_export = export_data[0]
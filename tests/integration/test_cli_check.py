@@ -3,61 +3,133 @@
 from __future__ import annotations
 
 import json
+import shutil
+import uuid
 from datetime import date
 from typing import TYPE_CHECKING
 
-from typer.testing import CliRunner
+import pytest
 
-from timereg.cli.app import app, state
+from tests.conftest import ClickRunner
 from timereg.core.database import Database
 from timereg.core.entries import create_entry
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
     from pathlib import Path
 
-runner = CliRunner()
+    from typer.core import TyperGroup
 
+runner = ClickRunner()
 
-def _setup(tmp_path: Path) -> Database:
-    db = Database(tmp_path / "test.db")
-    db.migrate()
-    state.db = db
-    state.output_format = "text"
-    state.db_path = tmp_path / "test.db"
+
+@pytest.fixture(scope="session")
+def check_db_template(tmp_path_factory: pytest.TempPathFactory, migrated_db_template: Path) -> Path:
+    """Migrated database seeded with the test project, built once per session."""
+    path = tmp_path_factory.mktemp("check-db") / "template.db"
+    shutil.copyfile(migrated_db_template, path)
+    db = Database(path)
     db.execute(
         "INSERT INTO projects (name, slug, weekly_hours) VALUES (?, ?, ?)",
         ("Test Project", "test", 20.0),
     )
     db.commit()
+    db.close()
+    return path
+
+
+def _setup(template: Path) -> Database:
+    # A named shared-cache in-memory database: the CLI's own connection opened from
+    # --db-path sees the same data for as long as this connection stays open.
+    db = Database(f"file:check_{uuid.uuid4().hex}?mode=memory&cache=shared")
+    db.load(template)
     return db
 
 
-def _db_args(tmp_path: Path) -> list[str]:
-    """Return global --db-path args (must precede the subcommand)."""
-    return ["--db-path", str(tmp_path / "test.db")]
+# Scenario name -> the single entry (hours, date) its database holds.
+_SCENARIOS = {
+    "normal_day": (7.5, date(2026, 2, 25)),
+    "long_day": (14.0, date(2026, 2, 25)),
+    "over_budget": (25.0, date(2026, 2, 24)),
+}
 
 
-class TestCheckCLI:
-    def test_check_normal_day(self, tmp_path: Path) -> None:
-        db = _setup(tmp_path)
+@pytest.fixture(scope="class")
+def check_scenarios(check_db_template: Path) -> Generator[dict[str, Database], None, None]:
+    """One populated database per entry in _SCENARIOS, shared by a test class."""
+    scenarios = {}
+    for name, (hours, entry_date) in _SCENARIOS.items():
+        db = _setup(check_db_template)
         create_entry(
             db=db,
             project_id=1,
-            hours=7.5,
+            hours=hours,
             short_summary="Work",
-            entry_date=date(2026, 2, 25),
+            entry_date=entry_date,
             git_user_name="Test",
             git_user_email="test@test.com",
             entry_type="manual",
         )
+        scenarios[name] = db
+    yield scenarios
+    for db in scenarios.values():
+        db.close()
+
+
+def _db_args(db: Database) -> list[str]:
+    """Return global --db-path args (must precede the subcommand)."""
+    return ["--db-path", str(db.path)]
+
+
+class TestCheckCLI:
+    @pytest.mark.parametrize(
+        ("scenario", "expected"),
+        [
+            ("normal_day", None),
+            ("long_day", "seems high"),
+            ("over_budget", "over budget"),
+        ],
+    )
+    def test_check_day(
+        self,
+        click_app: TyperGroup,
+        check_scenarios: dict[str, Database],
+        scenario: str,
+        expected: str | None,
+    ) -> None:
+        db = check_scenarios[scenario]
+        day = _SCENARIOS[scenario][1].isoformat()
+        result = runner.invoke(click_app, [*_db_args(db), "check", "--day", "--date", day])
+        assert result.exit_code == 0
+        if expected is not None:
+            assert expected in result.output.lower()
+
+    @pytest.mark.parametrize(
+        ("scenario", "expected_keys"),
+        [
+            ("normal_day", ["days", "summary_total"]),
+            ("over_budget", ["budget_warnings"]),
+        ],
+    )
+    def test_check_day_json(
+        self,
+        click_app: TyperGroup,
+        check_scenarios: dict[str, Database],
+        scenario: str,
+        expected_keys: list[str],
+    ) -> None:
+        db = check_scenarios[scenario]
+        day = _SCENARIOS[scenario][1].isoformat()
         result = runner.invoke(
-            app,
-            [*_db_args(tmp_path), "check", "--day", "--date", "2026-02-25"],
+            click_app, [*_db_args(db), "--format", "json", "check", "--day", "--date", day]
         )
         assert result.exit_code == 0
+        data = json.loads(result.stdout_bytes)
+        for key in expected_keys:
+            assert data[key]
 
-    def test_check_missing_day(self, tmp_path: Path) -> None:
-        db = _setup(tmp_path)
+    def test_check_missing_day(self, click_app: TyperGroup, check_db_template: Path) -> None:
+        db = _setup(check_db_template)
         # Register hours on Mon only, check Mon-Wed
         create_entry(
             db=db,
@@ -70,124 +142,28 @@ class TestCheckCLI:
             entry_type="manual",
         )
         result = runner.invoke(
-            app,
-            [*_db_args(tmp_path), "check", "--from", "2026-02-24", "--to", "2026-02-26"],
+            click_app,
+            [*_db_args(db), "check", "--from", "2026-02-24", "--to", "2026-02-26"],
         )
         assert result.exit_code == 0
         # Should show warnings for Tue and Wed
         output_lower = result.output.lower()
         assert "no hours" in output_lower or "warning" in output_lower or "!" in result.output
 
-    def test_check_json(self, tmp_path: Path) -> None:
-        db = _setup(tmp_path)
-        create_entry(
-            db=db,
-            project_id=1,
-            hours=7.5,
-            short_summary="Work",
-            entry_date=date(2026, 2, 25),
-            git_user_name="Test",
-            git_user_email="test@test.com",
-            entry_type="manual",
-        )
-        result = runner.invoke(
-            app,
-            [
-                *_db_args(tmp_path),
-                "--format",
-                "json",
-                "check",
-                "--day",
-                "--date",
-                "2026-02-25",
-            ],
-        )
-        assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert "days" in data
-        assert "summary_total" in data
-
-    def test_check_weekly_default(self, tmp_path: Path) -> None:
-        _setup(tmp_path)
-        result = runner.invoke(
-            app,
-            [*_db_args(tmp_path), "check", "--date", "2026-02-25"],
-        )
-        assert result.exit_code == 0
-
-    def test_check_high_hours_warning(self, tmp_path: Path) -> None:
-        db = _setup(tmp_path)
-        create_entry(
-            db=db,
-            project_id=1,
-            hours=14.0,
-            short_summary="Long day",
-            entry_date=date(2026, 2, 25),
-            git_user_name="Test",
-            git_user_email="test@test.com",
-            entry_type="manual",
-        )
-        result = runner.invoke(
-            app,
-            [*_db_args(tmp_path), "check", "--day", "--date", "2026-02-25"],
-        )
-        assert result.exit_code == 0
-        assert "!" in result.output or "high" in result.output.lower()
-
-    def test_check_budget_over(self, tmp_path: Path) -> None:
-        db = _setup(tmp_path)
-        # 25h against 20h weekly budget
-        create_entry(
-            db=db,
-            project_id=1,
-            hours=25.0,
-            short_summary="Over budget",
-            entry_date=date(2026, 2, 24),
-            git_user_name="Test",
-            git_user_email="test@test.com",
-            entry_type="manual",
-        )
+    def test_check_weekly_default(self, click_app: TyperGroup, check_db_template: Path) -> None:
+        db = _setup(check_db_template)
         result = runner.invoke(
-            app,
-            [*_db_args(tmp_path), "check", "--day", "--date", "2026-02-24"],
+            click_app,
+            [*_db_args(db), "check", "--date", "2026-02-25"],
         )
         assert result.exit_code == 0
-        output_lower = result.output.lower()
-        assert "over budget" in output_lower or "125%" in result.output
 
-    def test_check_mutually_exclusive_periods(self, tmp_path: Path) -> None:
-        _setup(tmp_path)
+    def test_check_mutually_exclusive_periods(
+        self, click_app: TyperGroup, check_db_template: Path
+    ) -> None:
+        db = _setup(check_db_template)
         result = runner.invoke(
-            app,
-            [*_db_args(tmp_path), "check", "--day", "--week"],
+            click_app,
+            [*_db_args(db), "check", "--day", "--week"],
         )
         assert result.exit_code != 0
-
-    def test_check_json_budget_warnings(self, tmp_path: Path) -> None:
-        db = _setup(tmp_path)
-        create_entry(
-            db=db,
-            project_id=1,
-            hours=25.0,
-            short_summary="Over budget",
-            entry_date=date(2026, 2, 24),
-            git_user_name="Test",
-            git_user_email="test@test.com",
-            entry_type="manual",
-        )
-        result = runner.invoke(
-            app,
-            [
-                *_db_args(tmp_path),
-                "--format",
-                "json",
-                "check",
-                "--day",
-                "--date",
-                "2026-02-24",
-            ],
-        )
-        assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert "budget_warnings" in data
-        assert len(data["budget_warnings"]) > 0
@@ -2,467 +2,153 @@
 
 from __future__ import annotations
 
-import json
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from typer.testing import CliRunner
+import pytest
 
-from timereg.cli.app import app
+from tests.conftest import invoke, invoke_json, register_entry
+from timereg.core.database import Database
+from timereg.core.entries import get_entry, list_entries
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from tests.conftest import CliContext
 
-    import pytest
 
-runner = CliRunner()
+def _entry_exists(ctx: CliContext, entry_id: int) -> bool:
+    """Whether the entry is still in the database, looked up by primary key."""
+    with Database(ctx.db_path) as db:
+        return get_entry(db, entry_id) is not None
 
 
-def _register_entry(
-    db_path: str,
-    hours: str = "2",
-    short_summary: str = "Test entry",
-    date_str: str | None = None,
-    env: dict[str, str] | None = None,
-) -> dict:
-    """Helper: register an entry and return the JSON response."""
-    today = date_str or date.today().isoformat()
-    result = runner.invoke(
-        app,
+def _listed_ids(ctx: CliContext) -> list[int]:
+    """IDs of today's entries, read straight from the database.
+
+    The `list` command itself is covered by test_cli_list; going through the CLI here
+    would only add a second invocation to every post-mutation check.
+    """
+    with Database(ctx.db_path) as db:
+        entries = list_entries(db, date_filter=date.fromisoformat(ctx.today))
+    return [e.id for e in entries if e.id is not None]
+
+
+class TestEditCommand:
+    @pytest.mark.parametrize(
+        ("args", "expected"),
         [
-            "--db-path",
-            db_path,
-            "--format",
-            "json",
-            "register",
-            "--hours",
-            hours,
-            "--short-summary",
-            short_summary,
-            "--date",
-            today,
+            (["--hours", "3h30m"], {"hours": 3.5}),
+            (["--short-summary", "New summary"], {"short_summary": "New summary"}),
         ],
-        catch_exceptions=False,
-        env=env,
     )
-    assert result.exit_code == 0
-    return json.loads(result.stdout)
+    def test_edit_fields(self, ctx: CliContext, args: list[str], expected: dict[str, Any]) -> None:
+        """Edit fields of an existing entry."""
+        entry = register_entry(ctx, hours="2", short_summary="Old summary")
 
+        updated = invoke_json(ctx, "edit", str(entry["id"]), *args)
+        assert {key: updated[key] for key in expected} == expected
 
-class TestEditCommand:
-    def test_edit_hours(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Edit the hours of an existing entry."""
-        config = git_repo / ".timereg.toml"
-        config.write_text('[project]\nname = "Test"\nslug = "test"\n')
-
-        monkeypatch.chdir(git_repo)
-        db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
-
-        entry = _register_entry(db_path, hours="2", short_summary="Work", date_str=today, env=env)
-        entry_id = entry["id"]
-
-        result = runner.invoke(
-            app,
-            [
-                "--db-path",
-                db_path,
-                "--format",
-                "json",
-                "edit",
-                str(entry_id),
-                "--hours",
-                "3h30m",
-            ],
-            catch_exceptions=False,
-            env=env,
-        )
-        assert result.exit_code == 0
-        updated = json.loads(result.stdout)
-        assert updated["hours"] == 3.5
-
-    def test_edit_summary(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Edit the summary of an existing entry."""
-        config = git_repo / ".timereg.toml"
-        config.write_text('[project]\nname = "Test"\nslug = "test"\n')
-
-        monkeypatch.chdir(git_repo)
-        db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
-
-        entry = _register_entry(
-            db_path, hours="2", short_summary="Old summary", date_str=today, env=env
-        )
-        entry_id = entry["id"]
-
-        result = runner.invoke(
-            app,
-            [
-                "--db-path",
-                db_path,
-                "--format",
-                "json",
-                "edit",
-                str(entry_id),
-                "--short-summary",
-                "New summary",
-            ],
-            catch_exceptions=False,
-            env=env,
-        )
-        assert result.exit_code == 0
-        updated = json.loads(result.stdout)
-        assert updated["short_summary"] == "New summary"
-
-    def test_edit_text_output(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_edit_text_output(self, ctx: CliContext) -> None:
         """Edit in text mode shows confirmation."""
-        config = git_repo / ".timereg.toml"
-        config.write_text('[project]\nname = "Test"\nslug = "test"\n')
-
-        monkeypatch.chdir(git_repo)
-        db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
-
-        entry = _register_entry(db_path, hours="2", short_summary="Work", date_str=today, env=env)
-        entry_id = entry["id"]
-
-        result = runner.invoke(
-            app,
-            [
-                "--db-path",
-                db_path,
-                "edit",
-                str(entry_id),
-                "--hours",
-                "4",
-            ],
-            catch_exceptions=False,
-            env=env,
-        )
+        entry_id = register_entry(ctx, hours="2", short_summary="Work")["id"]
+
+        result = invoke(ctx, "edit", str(entry_id), "--hours", "4")
         assert result.exit_code == 0
         assert f"Updated entry {entry_id}" in result.stdout
 
-    def test_edit_no_fields_fails(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_edit_no_fields_fails(self, ctx: CliContext) -> None:
         """Edit with no fields to update should fail."""
-        config = git_repo / ".timereg.toml"
-        config.write_text('[project]\nname = "Test"\nslug = "test"\n')
-
-        monkeypatch.chdir(git_repo)
-        db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
-
-        entry = _register_entry(db_path, hours="2", short_summary="Work", date_str=today, env=env)
-        entry_id = entry["id"]
-
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "edit", str(entry_id)],
-            catch_exceptions=False,
-            env=env,
-        )
+        entry_id = register_entry(ctx, hours="2", short_summary="Work")["id"]
+
+        result = invoke(ctx, "edit", str(entry_id))
         assert result.exit_code == 1
 
 
 class TestDeleteCommand:
-    def test_delete_entry(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_delete_entry(self, ctx: CliContext) -> None:
         """Delete an entry and verify it is gone."""
-        config = git_repo / ".timereg.toml"
-        config.write_text('[project]\nname = "Test"\nslug = "test"\n')
-
-        monkeypatch.chdir(git_repo)
-        db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
-
-        entry = _register_entry(
-            db_path, hours="2", short_summary="To delete", date_str=today, env=env
-        )
-        entry_id = entry["id"]
-
-        # Delete
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "--format", "json", "delete", str(entry_id)],
-            catch_exceptions=False,
-            env=env,
-        )
-        assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        entry_id = register_entry(ctx, hours="2", short_summary="To delete")["id"]
+
+        data = invoke_json(ctx, "delete", str(entry_id))
         assert data["deleted"] == [entry_id]
 
-        # Verify gone
-        list_result = runner.invoke(
-            app,
-            ["--db-path", db_path, "--format", "json", "list", "--date", today],
-            catch_exceptions=False,
-            env=env,
-        )
-        assert list_result.exit_code == 0
-        entries = json.loads(list_result.stdout)
-        assert all(e["id"] != entry_id for e in entries)
-
-    def test_delete_nonexistent_fails(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+        assert not _entry_exists(ctx, entry_id)
+
+    def test_delete_nonexistent_fails(self, ctx: CliContext) -> None:
         """Deleting a non-existent entry should fail."""
-        config = git_repo / ".timereg.toml"
-        config.write_text('[project]\nname = "Test"\nslug = "test"\n')
-
-        monkeypatch.chdir(git_repo)
-        db_path = str(tmp_path / "test.db")
-
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "delete", "9999"],
-            catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
-        )
+        result = invoke(ctx, "delete", "9999")
         assert result.exit_code == 1
 
-    def test_delete_text_output(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_delete_text_output(self, ctx: CliContext) -> None:
         """Delete in text mode shows confirmation."""
-        config = git_repo / ".timereg.toml"
-        config.write_text('[project]\nname = "Test"\nslug = "test"\n')
-
-        monkeypatch.chdir(git_repo)
-        db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
-
-        entry = _register_entry(db_path, hours="1", short_summary="Gone", date_str=today, env=env)
-        entry_id = entry["id"]
-
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "delete", str(entry_id)],
-            input="y\n",
-            catch_exceptions=False,
-            env=env,
-        )
+        entry_id = register_entry(ctx, hours="1", short_summary="Gone")["id"]
+
+        result = invoke(ctx, "delete", str(entry_id), input="y\n")
         assert result.exit_code == 0
         assert "This will delete 1 entry" in result.stdout
         assert "Gone" in result.stdout
         assert f"Deleted 1 entry: {entry_id}" in result.stdout
 
-    def test_delete_aborted_by_user(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_delete_aborted_by_user(self, ctx: CliContext) -> None:
         """Delete aborted when user says no."""
-        config = git_repo / ".timereg.toml"
-        config.write_text('[project]\nname = "Test"\nslug = "test"\n')
-
-        monkeypatch.chdir(git_repo)
-        db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
-
-        entry = _register_entry(
-            db_path, hours="1", short_summary="Keep me", date_str=today, env=env
-        )
-        entry_id = entry["id"]
-
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "delete", str(entry_id)],
-            input="n\n",
-            catch_exceptions=False,
-            env=env,
-        )
+        entry_id = register_entry(ctx, hours="1", short_summary="Keep me")["id"]
+
+        result = invoke(ctx, "delete", str(entry_id), input="n\n")
         assert result.exit_code == 0
         assert "Aborted" in result.stdout
 
-        # Verify entry still exists
-        list_result = runner.invoke(
-            app,
-            ["--db-path", db_path, "--format", "json", "list", "--date", today],
-            catch_exceptions=False,
-            env=env,
-        )
-        entries = json.loads(list_result.stdout)
-        assert any(e["id"] == entry_id for e in entries)
-
-    def test_delete_yes_flag_skips_prompt(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+        assert _entry_exists(ctx, entry_id)
+
+    def test_delete_yes_flag_skips_prompt(self, ctx: CliContext) -> None:
         """--yes flag skips the confirmation prompt."""
-        config = git_repo / ".timereg.toml"
-        config.write_text('[project]\nname = "Test"\nslug = "test"\n')
-
-        monkeypatch.chdir(git_repo)
-        db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
-
-        entry = _register_entry(db_path, hours="1", short_summary="Bye", date_str=today, env=env)
-        entry_id = entry["id"]
-
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "delete", "--yes", str(entry_id)],
-            catch_exceptions=False,
-            env=env,
-        )
+        entry_id = register_entry(ctx, hours="1", short_summary="Bye")["id"]
+
+        result = invoke(ctx, "delete", "--yes", str(entry_id))
         assert result.exit_code == 0
         assert "Are you sure" not in result.stdout
         assert f"Deleted 1 entry: {entry_id}" in result.stdout
 
-    def test_delete_multiple_entries(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_delete_multiple_entries(self, ctx: CliContext) -> None:
         """Delete multiple entries in a single command."""
-        config = git_repo / ".timereg.toml"
-        config.write_text('[project]\nname = "Test"\nslug = "test"\n')
-
-        monkeypatch.chdir(git_repo)
-        db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
-
-        e1 = _register_entry(db_path, hours="1", short_summary="First", date_str=today, env=env)
-        e2 = _register_entry(db_path, hours="2", short_summary="Second", date_str=today, env=env)
-        e3 = _register_entry(db_path, hours="3", short_summary="Keep", date_str=today, env=env)
-
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "--format", "json", "delete", str(e1["id"]), str(e2["id"])],
-            catch_exceptions=False,
-            env=env,
-        )
-        assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        e1 = register_entry(ctx, hours="1", short_summary="First")
+        e2 = register_entry(ctx, hours="2", short_summary="Second")
+        e3 = register_entry(ctx, hours="3", short_summary="Keep")
+
+        data = invoke_json(ctx, "delete", str(e1["id"]), str(e2["id"]))
         assert data["deleted"] == [e1["id"], e2["id"]]
 
         # Verify only the third entry remains
-        list_result = runner.invoke(
-            app,
-            ["--db-path", db_path, "--format", "json", "list", "--date", today],
-            catch_exceptions=False,
-            env=env,
-        )
-        entries = json.loads(list_result.stdout)
-        assert len(entries) == 1
-        assert entries[0]["id"] == e3["id"]
-
-    def test_delete_multiple_text_output(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+        assert _listed_ids(ctx) == [e3["id"]]
+
+    def test_delete_multiple_text_output(self, ctx: CliContext) -> None:
         """Delete multiple entries shows correct text output."""
-        config = git_repo / ".timereg.toml"
-        config.write_text('[project]\nname = "Test"\nslug = "test"\n')
-
-        monkeypatch.chdir(git_repo)
-        db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
-
-        e1 = _register_entry(db_path, hours="1", short_summary="A", date_str=today, env=env)
-        e2 = _register_entry(db_path, hours="2", short_summary="B", date_str=today, env=env)
-
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "delete", str(e1["id"]), str(e2["id"])],
-            input="y\n",
-            catch_exceptions=False,
-            env=env,
-        )
+        e1 = register_entry(ctx, hours="1", short_summary="A")
+        e2 = register_entry(ctx, hours="2", short_summary="B")
+
+        result = invoke(ctx, "delete", str(e1["id"]), str(e2["id"]), input="y\n")
         assert result.exit_code == 0
         assert "This will delete 2 entries" in result.stdout
         assert "Deleted 2 entries" in result.stdout
 
 
 class TestUndoCommand:
-    def test_undo_last_entry(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_undo_last_entry(self, ctx: CliContext) -> None:
         """Undo removes the most recent entry by the current user."""
-        config = git_repo / ".timereg.toml"
-        config.write_text('[project]\nname = "Test"\nslug = "test"\n')
-
-        monkeypatch.chdir(git_repo)
-        db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
-
-        entry = _register_entry(
-            db_path, hours="2", short_summary="Undo me", date_str=today, env=env
-        )
-        entry_id = entry["id"]
-
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "--format", "json", "undo"],
-            catch_exceptions=False,
-            env=env,
-        )
-        assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        entry_id = register_entry(ctx, hours="2", short_summary="Undo me")["id"]
+
+        data = invoke_json(ctx, "undo")
         assert data["undone"]["id"] == entry_id
 
-        # Verify entry is gone
-        list_result = runner.invoke(
-            app,
-            ["--db-path", db_path, "--format", "json", "list", "--date", today],
-            catch_exceptions=False,
-            env=env,
-        )
-        entries = json.loads(list_result.stdout)
-        assert all(e["id"] != entry_id for e in entries)
-
-    def test_undo_nothing(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+        assert not _entry_exists(ctx, entry_id)
+
+    def test_undo_nothing(self, ctx: CliContext) -> None:
         """Undo with no entries returns nothing."""
-        config = git_repo / ".timereg.toml"
-        config.write_text('[project]\nname = "Test"\nslug = "test"\n')
-
-        monkeypatch.chdir(git_repo)
-        db_path = str(tmp_path / "test.db")
-
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "--format", "json", "undo"],
-            catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
-        )
-        assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = invoke_json(ctx, "undo")
         assert data["undone"] is None
 
-    def test_undo_text_output(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_undo_text_output(self, ctx: CliContext) -> None:
         """Undo in text mode shows confirmation."""
-        config = git_repo / ".timereg.toml"
-        config.write_text('[project]\nname = "Test"\nslug = "test"\n')
-
-        monkeypatch.chdir(git_repo)
-        db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
-
-        _register_entry(db_path, hours="1", short_summary="Undone", date_str=today, env=env)
-
-        result = runner.invoke(
-            app,
-            ["--db-path", db_path, "undo"],
-            catch_exceptions=False,
-            env=env,
-        )
+        register_entry(ctx, hours="1", short_summary="Undone")
+
+        result = invoke(ctx, "undo")
         assert result.exit_code == 0
         assert "Undone entry" in result.stdout
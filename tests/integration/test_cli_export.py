@@ -3,24 +3,27 @@
 import csv
 import io
 import json
+from collections.abc import Iterator
+from contextlib import redirect_stdout
 from datetime import date
 from pathlib import Path
 
-from typer.testing import CliRunner
+from typer.core import TyperGroup
 
-from timereg.cli.app import app, state
+from tests.conftest import ClickRunner, seed_entries
+from timereg.cli.app import state
+from timereg.cli.export import export
 from timereg.core.database import Database
 from timereg.core.entries import create_entry
 
-runner = CliRunner()
+runner = ClickRunner()
 
 
-def _setup(tmp_path: Path) -> Database:
-    db = Database(tmp_path / "test.db")
-    db.migrate()
+def _setup(db_path: str) -> Database:
+    db = Database(db_path)
     state.db = db
     state.output_format = "text"
-    state.db_path = tmp_path / "test.db"
+    state.db_path = Path(db_path)
     db.execute(
         "INSERT INTO projects (name, slug) VALUES (?, ?)",
         ("Test Project", "test"),
@@ -29,14 +32,31 @@ def _setup(tmp_path: Path) -> Database:
     return db
 
 
-def _db_args(tmp_path: Path) -> list[str]:
+def _export(**options: str) -> str:
+    """Call the export command function in-process against state.db; return its output.
+
+    Argument parsing is covered once through the runner by test_export_csv_default.
+    """
+    out = io.StringIO()
+    with redirect_stdout(out):
+        export(**options)
+    return out.getvalue()
+
+
+def _assert_single_row(reader: Iterator[list[str]]) -> None:
+    """Assert exactly one row remains, reading no further than the row after it."""
+    assert next(reader, None) is not None
+    assert next(reader, None) is None
+
+
+def _db_args(db_path: str) -> list[str]:
     """Return global --db-path args (must precede the subcommand)."""
-    return ["--db-path", str(tmp_path / "test.db")]
+    return ["--db-path", db_path]
 
 
 class TestExportCLI:
-    def test_export_csv_default(self, tmp_path: Path) -> None:
-        db = _setup(tmp_path)
+    def test_export_csv_default(self, click_app: TyperGroup, db_path: str) -> None:
+        db = _setup(db_path)
         create_entry(
             db=db,
             project_id=1,
@@ -48,19 +68,16 @@ class TestExportCLI:
             entry_type="manual",
         )
         result = runner.invoke(
-            app,
-            [*_db_args(tmp_path), "export"],
+            click_app,
+            [*_db_args(db_path), "export"],
         )
         assert result.exit_code == 0
         reader = csv.reader(io.StringIO(result.output))
-        header = next(reader)
-        assert "date" in header
-        assert "hours" in header
-        rows = list(reader)
-        assert len(rows) == 1
-
-    def test_export_json(self, tmp_path: Path) -> None:
-        db = _setup(tmp_path)
+        assert set(next(reader)) >= {"date", "hours"}
+        _assert_single_row(reader)
+
+    def test_export_json(self, db_path: str) -> None:
+        db = _setup(db_path)
         create_entry(
             db=db,
             project_id=1,
@@ -71,85 +88,26 @@ class TestExportCLI:
             git_user_email="test@test.com",
             entry_type="manual",
         )
-        result = runner.invoke(
-            app,
-            [*_db_args(tmp_path), "export", "--export-format", "json"],
-        )
-        assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = json.loads(_export(export_format="json"))
         assert isinstance(data, list)
         assert len(data) == 1
 
-    def test_export_project_filter(self, tmp_path: Path) -> None:
-        db = _setup(tmp_path)
+    def test_export_project_filter(self, db_path: str) -> None:
+        db = _setup(db_path)
         db.execute("INSERT INTO projects (name, slug) VALUES (?, ?)", ("Other", "other"))
         db.commit()
-        create_entry(
-            db=db,
-            project_id=1,
-            hours=4.0,
-            short_summary="Test",
-            entry_date=date(2026, 2, 25),
-            git_user_name="Test",
-            git_user_email="test@test.com",
-            entry_type="manual",
-        )
-        create_entry(
-            db=db,
-            project_id=2,
-            hours=3.0,
-            short_summary="Other",
-            entry_date=date(2026, 2, 25),
-            git_user_name="Test",
-            git_user_email="test@test.com",
-            entry_type="manual",
-        )
-        result = runner.invoke(
-            app,
-            [*_db_args(tmp_path), "export", "--project", "test"],
-        )
-        assert result.exit_code == 0
-        reader = csv.reader(io.StringIO(result.output))
+        seed_entries(db, [(1, "2026-02-25", 4.0, "Test"), (2, "2026-02-25", 3.0, "Other")])
+        reader = csv.reader(io.StringIO(_export(project_slug="test")))
         next(reader)
-        rows = list(reader)
-        assert len(rows) == 1
+        _assert_single_row(reader)
 
-    def test_export_date_range(self, tmp_path: Path) -> None:
-        db = _setup(tmp_path)
-        create_entry(
-            db=db,
-            project_id=1,
-            hours=2.0,
-            short_summary="In",
-            entry_date=date(2026, 2, 25),
-            git_user_name="Test",
-            git_user_email="test@test.com",
-            entry_type="manual",
-        )
-        create_entry(
-            db=db,
-            project_id=1,
-            hours=3.0,
-            short_summary="Out",
-            entry_date=date(2026, 3, 5),
-            git_user_name="Test",
-            git_user_email="test@test.com",
-            entry_type="manual",
-        )
-        result = runner.invoke(
-            app,
-            [*_db_args(tmp_path), "export", "--from", "2026-02-01", "--to", "2026-02-28"],
-        )
-        assert result.exit_code == 0
-        reader = csv.reader(io.StringIO(result.output))
+    def test_export_date_range(self, db_path: str) -> None:
+        db = _setup(db_path)
+        seed_entries(db, [(1, "2026-02-25", 2.0, "In"), (1, "2026-03-05", 3.0, "Out")])
+        reader = csv.reader(io.StringIO(_export(date_from="2026-02-01", date_to="2026-02-28")))
         next(reader)
-        rows = list(reader)
-        assert len(rows) == 1
+        _assert_single_row(reader)
 
-    def test_export_empty(self, tmp_path: Path) -> None:
-        _setup(tmp_path)
-        result = runner.invoke(
-            app,
-            [*_db_args(tmp_path), "export"],
-        )
-        assert result.exit_code == 0
+    def test_export_empty(self, db_path: str) -> None:
+        _setup(db_path)
+        _assert_single_row(csv.reader(io.StringIO(_export())))  # header only
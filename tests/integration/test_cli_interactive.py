@@ -2,65 +2,46 @@
 
 from __future__ import annotations
 
-from datetime import date
+import json
 from typing import TYPE_CHECKING
 
-from typer.testing import CliRunner
-
-from timereg.cli.app import app
+from tests.conftest import ClickRunner, seed_projects
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     import pytest
+    from typer.core import TyperGroup
 
-runner = CliRunner()
+runner = ClickRunner()
 
 
 class TestInteractiveMode:
     def test_interactive_with_existing_project(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, today_iso: str
     ) -> None:
         """Interactive mode with a pre-created project registers an entry."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
 
         # First, create a project so interactive mode can select it
-        result = runner.invoke(
-            app,
-            [
-                "--db-path",
-                db_path,
-                "projects",
-                "add",
-                "--name",
-                "My Project",
-                "--slug",
-                "my-project",
-            ],
-            catch_exceptions=False,
-            env=env,
-        )
-        assert result.exit_code == 0
+        seed_projects(db_path, [("My Project", "my-project")])
 
         # Run interactive mode with stdin providing answers:
         # - project number: 1 (single project, auto-selected)
-        # - date: <enter> (default today)
+        # - date: <enter> (default today_iso)
         # - hours: 2h30m
         # - description: Worked on feature
         # - tags: <enter> (none)
         # With a single project it is auto-selected, so prompts are:
         # date, hours, description, tags
-        interactive_input = f"{today}\n2h30m\nWorked on feature\n\n"
+        interactive_input = f"{today_iso}\n2h30m\nWorked on feature\n\n"
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path],
             input=interactive_input,
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
         assert "Registered 2.5h" in result.output
@@ -69,38 +50,32 @@ class TestInteractiveMode:
 
         # Verify the entry was actually created by listing
         list_result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "--format", "json", "list", "--all"],
             catch_exceptions=False,
-            env=env,
         )
         assert list_result.exit_code == 0
-        import json
-
-        entries = json.loads(list_result.stdout)
+        entries = json.loads(list_result.stdout_bytes)
         assert len(entries) == 1
         assert entries[0]["short_summary"] == "Worked on feature"
         assert entries[0]["hours"] == 2.5
 
     def test_interactive_create_project_when_none_exist(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, today_iso: str
     ) -> None:
         """Interactive mode prompts to create a project when none exist."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
 
         # Prompts: project name, project slug (Enter accepts default "new-project"),
         # date, hours, description, tags
-        interactive_input = f"New Project\n\n{today}\n1h\nInitial setup\n\n"
+        interactive_input = f"New Project\n\n{today_iso}\n1h\nInitial setup\n\n"
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path],
             input=interactive_input,
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
         assert "Created project" in result.output
@@ -108,59 +83,43 @@ class TestInteractiveMode:
         assert "Initial setup" in result.output
 
     def test_interactive_multiple_projects_select(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, today_iso: str
     ) -> None:
         """Interactive mode shows numbered list when multiple projects exist."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
-
-        # Create two projects
-        for name, slug in [("Alpha", "alpha"), ("Beta", "beta")]:
-            runner.invoke(
-                app,
-                ["--db-path", db_path, "projects", "add", "--name", name, "--slug", slug],
-                catch_exceptions=False,
-                env=env,
-            )
+
+        seed_projects(db_path, [("Alpha", "alpha"), ("Beta", "beta")])
 
         # Prompts: project number, date, hours, description, tags
-        interactive_input = f"2\n{today}\n3h\nBeta work\ndev,backend\n"
+        interactive_input = f"2\n{today_iso}\n3h\nBeta work\ndev,backend\n"
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path],
             input=interactive_input,
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
         assert "Registered 3.0h" in result.output
         assert "Tags: dev, backend" in result.output
 
-    def test_interactive_with_tags(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_interactive_with_tags(
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, today_iso: str
+    ) -> None:
         """Interactive mode correctly handles tags."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
-        today = date.today().isoformat()
 
-        runner.invoke(
-            app,
-            ["--db-path", db_path, "projects", "add", "--name", "Tagged", "--slug", "tagged"],
-            catch_exceptions=False,
-            env=env,
-        )
+        seed_projects(db_path, [("Tagged", "tagged")])
 
-        interactive_input = f"{today}\n45m\nCode review\nreview, pr\n"
+        interactive_input = f"{today_iso}\n45m\nCode review\nreview, pr\n"
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path],
             input=interactive_input,
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
         assert "Registered 0.75h" in result.output
@@ -5,26 +5,31 @@ from __future__ import annotations
 import json
 from typing import TYPE_CHECKING
 
-from typer.testing import CliRunner
+import pytest
 
-from timereg.cli.app import app
+from tests.conftest import ClickRunner
 
 if TYPE_CHECKING:
     from pathlib import Path
 
-    import pytest
+    from typer.core import TyperGroup
 
-runner = CliRunner()
+runner = ClickRunner()
+
+# These commands write global config under HOME: give each test its own.
+pytestmark = pytest.mark.usefixtures("fresh_home")
 
 
 class TestProjectsAdd:
-    def test_add_project(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_add_project(
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Add a project manually."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
 
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -38,7 +43,6 @@ class TestProjectsAdd:
                 "my-project",
             ],
             catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
@@ -46,14 +50,15 @@ class TestProjectsAdd:
         assert data["slug"] == "my-project"
         assert data["id"] is not None
 
-    def test_add_duplicate_fails(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_add_duplicate_fails(
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Adding a project with a duplicate slug should fail."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
 
         runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -65,11 +70,10 @@ class TestProjectsAdd:
                 "my-proj",
             ],
             catch_exceptions=False,
-            env=env,
         )
 
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -81,17 +85,18 @@ class TestProjectsAdd:
                 "my-proj",
             ],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 1
 
-    def test_add_text_output(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_add_text_output(
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Add a project in text format."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
 
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -103,7 +108,6 @@ class TestProjectsAdd:
                 "test",
             ],
             catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
         )
         assert result.exit_code == 0
         assert "Added project" in result.stdout
@@ -111,47 +115,44 @@ class TestProjectsAdd:
 
 
 class TestProjectsList:
-    def test_list_empty(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_list_empty(
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Listing with no projects returns empty."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "--format", "json", "projects", "list"],
             catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data == []
 
     def test_list_shows_added_projects(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """List shows previously added projects."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
 
         runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "projects", "add", "--name", "Alpha", "--slug", "alpha"],
             catch_exceptions=False,
-            env=env,
         )
         runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "projects", "add", "--name", "Beta", "--slug", "beta"],
             catch_exceptions=False,
-            env=env,
         )
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "--format", "json", "projects", "list"],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
@@ -159,77 +160,77 @@ class TestProjectsList:
         assert "alpha" in slugs
         assert "beta" in slugs
 
-    def test_list_text_no_projects(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_list_text_no_projects(
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Listing with no projects in text mode shows message."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "projects", "list"],
             catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
         )
         assert result.exit_code == 0
         assert "No projects registered" in result.stdout
 
 
 class TestProjectsShow:
-    def test_show_project(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_show_project(
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Show details for a project."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
 
         runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "projects", "add", "--name", "Show Me", "--slug", "show-me"],
             catch_exceptions=False,
-            env=env,
         )
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "--format", "json", "projects", "show", "show-me"],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["name"] == "Show Me"
         assert data["slug"] == "show-me"
 
-    def test_show_nonexistent_fails(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_show_nonexistent_fails(
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Showing a non-existent project should fail."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "projects", "show", "nope"],
             catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
         )
         assert result.exit_code == 1
 
-    def test_show_text_output(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_show_text_output(
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Show project in text mode."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
 
         runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "projects", "add", "--name", "My App", "--slug", "my-app"],
             catch_exceptions=False,
-            env=env,
         )
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "projects", "show", "my-app"],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
         assert "My App" in result.stdout
@@ -238,7 +239,7 @@ class TestProjectsShow:
 
 class TestProjectsAddFromConfig:
     def test_add_from_current_dir(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, click_app: TyperGroup, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Add a project from .timereg.toml in a directory."""
         config = git_repo / ".timereg.toml"
@@ -246,13 +247,11 @@ class TestProjectsAddFromConfig:
 
         monkeypatch.chdir(git_repo)
         db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "--format", "json", "projects", "add", "."],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
@@ -262,7 +261,7 @@ class TestProjectsAddFromConfig:
         assert data["config_path"] is not None
 
     def test_add_from_path_registers_repos(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, click_app: TyperGroup, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Adding from config also registers repo paths."""
         config = git_repo / ".timereg.toml"
@@ -270,30 +269,27 @@ class TestProjectsAddFromConfig:
 
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
 
         # Add using absolute path
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "--format", "json", "projects", "add", str(git_repo)],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
 
         # Show should list repos
         show_result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "--format", "json", "projects", "show", "repo"],
             catch_exceptions=False,
-            env=env,
         )
         assert show_result.exit_code == 0
         data = json.loads(show_result.stdout)
         assert len(data["repos"]) > 0
 
     def test_add_from_path_text_output(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, click_app: TyperGroup, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Text output shows config path and repo count."""
         config = git_repo / ".timereg.toml"
@@ -301,20 +297,20 @@ class TestProjectsAddFromConfig:
 
         monkeypatch.chdir(git_repo)
         db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "projects", "add", "."],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
         assert "Registered project" in result.stdout
         assert "text" in result.stdout
         assert "Config:" in result.stdout
 
-    def test_add_no_config_fails(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_add_no_config_fails(
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Adding from a dir without .timereg.toml fails."""
         no_config_dir = tmp_path / "empty"
         no_config_dir.mkdir()
@@ -323,29 +319,29 @@ class TestProjectsAddFromConfig:
         db_path = str(tmp_path / "test.db")
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "projects", "add", "."],
             catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
         )
         assert result.exit_code == 1
         assert ".timereg.toml" in result.stdout or ".timereg.toml" in (result.stderr or "")
 
-    def test_add_no_args_fails(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_add_no_args_fails(
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Calling 'projects add' with no path and no --name/--slug fails."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "projects", "add"],
             catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
         )
         assert result.exit_code == 1
 
     def test_add_updates_existing_project(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, click_app: TyperGroup, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Adding from config a second time updates the existing project."""
         config = git_repo / ".timereg.toml"
@@ -353,22 +349,19 @@ class TestProjectsAddFromConfig:
 
         monkeypatch.chdir(git_repo)
         db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
 
         runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "projects", "add", "."],
             catch_exceptions=False,
-            env=env,
         )
 
         # Update config and re-add
         config.write_text('[project]\nname = "V2"\nslug = "myproj"\n')
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "--format", "json", "projects", "add", "."],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
@@ -377,24 +370,23 @@ class TestProjectsAddFromConfig:
 
 
 class TestProjectsRemove:
-    def test_remove_project(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_remove_project(
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Remove a project and verify it is gone."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
 
         runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "projects", "add", "--name", "Doomed", "--slug", "doomed"],
             catch_exceptions=False,
-            env=env,
         )
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "--format", "json", "projects", "remove", "doomed"],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
@@ -402,48 +394,45 @@ class TestProjectsRemove:
 
         # Verify gone
         list_result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "--format", "json", "projects", "list"],
             catch_exceptions=False,
-            env=env,
         )
         projects = json.loads(list_result.stdout)
         slugs = [p["slug"] for p in projects]
         assert "doomed" not in slugs
 
     def test_remove_nonexistent_fails(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Removing a non-existent project should fail."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "projects", "remove", "nope"],
             catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
         )
         assert result.exit_code == 1
 
-    def test_remove_text_output(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_remove_text_output(
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Remove in text mode shows confirmation."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
-        env = {"HOME": str(tmp_path / "fakehome")}
 
         runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "projects", "add", "--name", "Bye", "--slug", "bye"],
             catch_exceptions=False,
-            env=env,
         )
 
         result = runner.invoke(
-            app,
+            click_app,
             ["--db-path", db_path, "projects", "remove", "bye"],
             catch_exceptions=False,
-            env=env,
         )
         assert result.exit_code == 0
         assert "Removed project" in result.stdout
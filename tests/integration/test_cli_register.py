@@ -3,21 +3,19 @@
 from __future__ import annotations
 
 import json
-from datetime import date
 from typing import TYPE_CHECKING
 
-from typer.testing import CliRunner
-
-from tests.conftest import make_commit
-from timereg.cli.app import app, state
+from tests.conftest import ClickRunner, fetched_hashes, make_commit
+from timereg.cli.app import state
 from timereg.core.database import Database
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     import pytest
+    from typer.core import TyperGroup
 
-runner = CliRunner()
+runner = ClickRunner()
 
 
 def _setup(tmp_path: Path) -> Database:
@@ -37,7 +35,12 @@ def _setup(tmp_path: Path) -> Database:
 
 class TestRegisterCommand:
     def test_register_manual_entry(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        click_app: TyperGroup,
+        git_repo: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        today_iso: str,
     ) -> None:
         """Register a manual entry and verify it appears in the database."""
         config = git_repo / ".timereg.toml"
@@ -45,10 +48,9 @@ class TestRegisterCommand:
 
         monkeypatch.chdir(git_repo)
         db_path = str(tmp_path / "test.db")
-        today = date.today().isoformat()
 
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -60,39 +62,42 @@ class TestRegisterCommand:
                 "--short-summary",
                 "Team standup and planning",
                 "--date",
-                today,
+                today_iso,
             ],
             catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["hours"] == 2.5
         assert data["short_summary"] == "Team standup and planning"
         assert data["entry_type"] == "manual"
-        assert data["date"] == today
+        assert data["date"] == today_iso
 
     def test_register_with_commits(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        click_app: TyperGroup,
+        git_repo: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        today_iso: str,
     ) -> None:
         """Register with commits and verify they are tracked."""
         config = git_repo / ".timereg.toml"
         config.write_text('[project]\nname = "Test"\nslug = "test"\n')
 
-        today = date.today().isoformat()
         commit_hash = make_commit(
             git_repo,
             "feature.py",
             "print('hello')",
             "feat: add feature",
-            commit_date=f"{today}T10:00:00+01:00",
+            commit_date=f"{today_iso}T10:00:00+01:00",
         )
 
         monkeypatch.chdir(git_repo)
         db_path = str(tmp_path / "test.db")
 
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -106,10 +111,9 @@ class TestRegisterCommand:
                 "--commits",
                 commit_hash,
                 "--date",
-                today,
+                today_iso,
             ],
             catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
@@ -118,21 +122,20 @@ class TestRegisterCommand:
 
         # Verify commit is tracked by fetching — it should no longer appear
         fetch_result = runner.invoke(
-            app,
-            ["--db-path", db_path, "--format", "json", "fetch", "--date", today],
+            click_app,
+            ["--db-path", db_path, "--format", "json", "fetch", "--date", today_iso],
             catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
         )
         assert fetch_result.exit_code == 0
-        fetch_data = json.loads(fetch_result.stdout)
-        all_commits = []
-        for repo in fetch_data["repos"]:
-            all_commits.extend(repo["commits"])
-        commit_hashes = [c["hash"] for c in all_commits]
-        assert commit_hash not in commit_hashes
+        assert commit_hash not in fetched_hashes(json.loads(fetch_result.stdout))
 
     def test_register_with_tags(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        click_app: TyperGroup,
+        git_repo: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        today_iso: str,
     ) -> None:
         """Register an entry with tags."""
         config = git_repo / ".timereg.toml"
@@ -140,10 +143,9 @@ class TestRegisterCommand:
 
         monkeypatch.chdir(git_repo)
         db_path = str(tmp_path / "test.db")
-        today = date.today().isoformat()
 
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -157,17 +159,21 @@ class TestRegisterCommand:
                 "--tags",
                 "review,code",
                 "--date",
-                today,
+                today_iso,
             ],
             catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["tags"] == ["review", "code"]
 
     def test_register_text_output(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        click_app: TyperGroup,
+        git_repo: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        today_iso: str,
     ) -> None:
         """Register an entry with text output format."""
         config = git_repo / ".timereg.toml"
@@ -175,10 +181,9 @@ class TestRegisterCommand:
 
         monkeypatch.chdir(git_repo)
         db_path = str(tmp_path / "test.db")
-        today = date.today().isoformat()
 
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -188,17 +193,16 @@ class TestRegisterCommand:
                 "--short-summary",
                 "Feature development",
                 "--date",
-                today,
+                today_iso,
             ],
             catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
         )
         assert result.exit_code == 0
         assert "Registered 4.5h" in result.stdout
         assert "Feature development" in result.stdout
 
     def test_register_invalid_hours_fails(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, click_app: TyperGroup, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Invalid time format should fail."""
         config = git_repo / ".timereg.toml"
@@ -208,7 +212,7 @@ class TestRegisterCommand:
         db_path = str(tmp_path / "test.db")
 
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -219,19 +223,18 @@ class TestRegisterCommand:
                 "test",
             ],
             catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
         )
         assert result.exit_code == 1
 
     def test_register_no_project_fails(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, click_app: TyperGroup, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Register without a project config or --project should fail."""
         monkeypatch.chdir(tmp_path)
         db_path = str(tmp_path / "test.db")
 
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -242,12 +245,16 @@ class TestRegisterCommand:
                 "test",
             ],
             catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
         )
         assert result.exit_code == 1
 
     def test_register_with_long_summary(
-        self, git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        click_app: TyperGroup,
+        git_repo: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        today_iso: str,
     ) -> None:
         """Register an entry with both short and long summary."""
         config = git_repo / ".timereg.toml"
@@ -255,10 +262,9 @@ class TestRegisterCommand:
 
         monkeypatch.chdir(git_repo)
         db_path = str(tmp_path / "test.db")
-        today = date.today().isoformat()
 
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 db_path,
@@ -273,10 +279,9 @@ class TestRegisterCommand:
                 "Implemented REST API endpoints for user management"
                 " including CRUD operations and auth middleware.",
                 "--date",
-                today,
+                today_iso,
             ],
             catch_exceptions=False,
-            env={"HOME": str(tmp_path / "fakehome")},
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
@@ -284,7 +289,7 @@ class TestRegisterCommand:
 
 
 class TestConstrainedTagsCLI:
-    def test_register_rejects_invalid_tag(self, tmp_path: Path) -> None:
+    def test_register_rejects_invalid_tag(self, click_app: TyperGroup, tmp_path: Path) -> None:
         """Register with a tag not in the allowed list should fail."""
         db = _setup(tmp_path)
         db.execute(
@@ -293,7 +298,7 @@ class TestConstrainedTagsCLI:
         )
         db.commit()
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 str(tmp_path / "test.db"),
@@ -313,7 +318,7 @@ class TestConstrainedTagsCLI:
         assert result.exit_code != 0
         assert "invalid" in result.output.lower()
 
-    def test_register_accepts_valid_tags(self, tmp_path: Path) -> None:
+    def test_register_accepts_valid_tags(self, click_app: TyperGroup, tmp_path: Path) -> None:
         """Register with tags that are all in the allowed list should succeed."""
         db = _setup(tmp_path)
         db.execute(
@@ -322,7 +327,7 @@ class TestConstrainedTagsCLI:
         )
         db.commit()
         result = runner.invoke(
-            app,
+            click_app,
             [
                 "--db-path",
                 str(tmp_path / "test.db"),
@@ -6,16 +6,17 @@ import json
 from datetime import date
 from typing import TYPE_CHECKING
 
-from typer.testing import CliRunner
-
-from timereg.cli.app import app, state
+from tests.conftest import ClickRunner
+from timereg.cli.app import state
 from timereg.core.database import Database
 from timereg.core.entries import create_entry
 
 if TYPE_CHECKING:
     from pathlib import Path
 
-runner = CliRunner()
+    from typer.core import TyperGroup
+
+runner = ClickRunner()
 
 
 def _setup(tmp_path: Path) -> Database:
@@ -38,7 +39,7 @@ def _db_args(tmp_path: Path) -> list[str]:
 
 
 class TestStatusCLI:
-    def test_status_with_entries(self, tmp_path: Path) -> None:
+    def test_status_with_entries(self, click_app: TyperGroup, tmp_path: Path) -> None:
         db = _setup(tmp_path)
         create_entry(
             db=db,
@@ -51,14 +52,14 @@ class TestStatusCLI:
             entry_type="manual",
         )
         result = runner.invoke(
-            app,
+            click_app,
             [*_db_args(tmp_path), "status", "--date", "2026-02-25"],
         )
         assert result.exit_code == 0
         assert "Test Project" in result.output
         assert "4.0" in result.output or "4.00" in result.output
 
-    def test_status_json(self, tmp_path: Path) -> None:
+    def test_status_json(self, click_app: TyperGroup, tmp_path: Path) -> None:
         db = _setup(tmp_path)
         create_entry(
             db=db,
@@ -71,7 +72,7 @@ class TestStatusCLI:
             entry_type="manual",
         )
         result = runner.invoke(
-            app,
+            click_app,
             [*_db_args(tmp_path), "--format", "json", "status", "--date", "2026-02-25"],
         )
         assert result.exit_code == 0
@@ -79,27 +80,27 @@ class TestStatusCLI:
         assert "projects" in data
         assert data["projects"][0]["today_hours"] == 3.5
 
-    def test_status_no_entries(self, tmp_path: Path) -> None:
+    def test_status_no_entries(self, click_app: TyperGroup, tmp_path: Path) -> None:
         _setup(tmp_path)
         result = runner.invoke(
-            app,
+            click_app,
             [*_db_args(tmp_path), "status", "--date", "2026-02-25"],
         )
         assert result.exit_code == 0
 
-    def test_status_no_projects(self, tmp_path: Path) -> None:
+    def test_status_no_projects(self, click_app: TyperGroup, tmp_path: Path) -> None:
         db = Database(tmp_path / "test.db")
         db.migrate()
         state.db = db
         state.output_format = "text"
         state.db_path = tmp_path / "test.db"
         result = runner.invoke(
-            app,
+            click_app,
             [*_db_args(tmp_path), "status", "--date", "2026-02-25"],
         )
         assert result.exit_code == 0
 
-    def test_status_budget_percent_in_json(self, tmp_path: Path) -> None:
+    def test_status_budget_percent_in_json(self, click_app: TyperGroup, tmp_path: Path) -> None:
         db = _setup(tmp_path)
         create_entry(
             db=db,
@@ -112,14 +113,14 @@ class TestStatusCLI:
             entry_type="manual",
         )
         result = runner.invoke(
-            app,
+            click_app,
             [*_db_args(tmp_path), "--format", "json", "status", "--date", "2026-02-25"],
         )
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert data["projects"][0]["budget_percent"] == 50.0
 
-    def test_status_week_hours(self, tmp_path: Path) -> None:
+    def test_status_week_hours(self, click_app: TyperGroup, tmp_path: Path) -> None:
         db = _setup(tmp_path)
         # Add entries across multiple days in the same week
         create_entry(
@@ -143,7 +144,7 @@ class TestStatusCLI:
             entry_type="manual",
         )
         result = runner.invoke(
-            app,
+            click_app,
             [*_db_args(tmp_path), "--format", "json", "status", "--date", "2026-02-25"],
         )
         assert result.exit_code == 0
@@ -151,10 +152,10 @@ class TestStatusCLI:
         assert data["projects"][0]["week_hours"] == 7.0
         assert data["projects"][0]["today_hours"] == 3.0
 
-    def test_status_warnings_shown(self, tmp_path: Path) -> None:
+    def test_status_warnings_shown(self, click_app: TyperGroup, tmp_path: Path) -> None:
         _setup(tmp_path)
         result = runner.invoke(
-            app,
+            click_app,
             [*_db_args(tmp_path), "--format", "json", "status", "--date", "2026-02-25"],
         )
         assert result.exit_code == 0
@@ -6,16 +6,17 @@ import json
 from datetime import date
 from typing import TYPE_CHECKING
 
-from typer.testing import CliRunner
-
-from timereg.cli.app import app, state
+from tests.conftest import ClickRunner
+from timereg.cli.app import state
 from timereg.core.database import Database
 from timereg.core.entries import create_entry
 
 if TYPE_CHECKING:
     from pathlib import Path
 
-runner = CliRunner()
+    from typer.core import TyperGroup
+
+runner = ClickRunner()
 
 
 def _setup(tmp_path: Path) -> Database:
@@ -38,7 +39,7 @@ def _db_args(tmp_path: Path) -> list[str]:
 
 
 class TestSummaryCLI:
-    def test_weekly_summary_text(self, tmp_path: Path) -> None:
+    def test_weekly_summary_text(self, click_app: TyperGroup, tmp_path: Path) -> None:
         db = _setup(tmp_path)
         create_entry(
             db=db,
@@ -51,14 +52,14 @@ class TestSummaryCLI:
             entry_type="manual",
         )
         result = runner.invoke(
-            app,
+            click_app,
             [*_db_args(tmp_path), "summary", "--week", "--date", "2026-02-25"],
         )
         assert result.exit_code == 0
         assert "Test Project" in result.output
         assert "4.0" in result.output or "4.00" in result.output
 
-    def test_weekly_summary_json(self, tmp_path: Path) -> None:
+    def test_weekly_summary_json(self, click_app: TyperGroup, tmp_path: Path) -> None:
         db = _setup(tmp_path)
         create_entry(
             db=db,
@@ -71,7 +72,7 @@ class TestSummaryCLI:
             entry_type="manual",
         )
         result = runner.invoke(
-            app,
+            click_app,
             [
                 *_db_args(tmp_path),
                 "--format",
@@ -86,15 +87,15 @@ class TestSummaryCLI:
         data = json.loads(result.output)
         assert data["total_hours"] == 4.0
 
-    def test_summary_no_entries(self, tmp_path: Path) -> None:
+    def test_summary_no_entries(self, click_app: TyperGroup, tmp_path: Path) -> None:
         _setup(tmp_path)
         result = runner.invoke(
-            app,
+            click_app,
             [*_db_args(tmp_path), "summary", "--week", "--date", "2026-02-25"],
         )
         assert result.exit_code == 0
 
-    def test_monthly_summary(self, tmp_path: Path) -> None:
+    def test_monthly_summary(self, click_app: TyperGroup, tmp_path: Path) -> None:
         db = _setup(tmp_path)
         create_entry(
             db=db,
@@ -117,7 +118,7 @@ class TestSummaryCLI:
             entry_type="manual",
         )
         result = runner.invoke(
-            app,
+            click_app,
             [
                 *_db_args(tmp_path),
                 "--format",
@@ -132,7 +133,7 @@ class TestSummaryCLI:
         data = json.loads(result.output)
         assert data["total_hours"] == 8.0
 
-    def test_daily_summary(self, tmp_path: Path) -> None:
+    def test_daily_summary(self, click_app: TyperGroup, tmp_path: Path) -> None:
         db = _setup(tmp_path)
         create_entry(
             db=db,
@@ -145,7 +146,7 @@ class TestSummaryCLI:
             entry_type="manual",
         )
         result = runner.invoke(
-            app,
+            click_app,
             [
                 *_db_args(tmp_path),
                 "--format",
@@ -160,7 +161,7 @@ class TestSummaryCLI:
         data = json.loads(result.output)
         assert data["total_hours"] == 2.0
 
-    def test_explicit_date_range(self, tmp_path: Path) -> None:
+    def test_explicit_date_range(self, click_app: TyperGroup, tmp_path: Path) -> None:
         db = _setup(tmp_path)
         create_entry(
             db=db,
@@ -193,7 +194,7 @@ class TestSummaryCLI:
             entry_type="manual",
         )
         result = runner.invoke(
-            app,
+            click_app,
             [
                 *_db_args(tmp_path),
                 "--format",
@@ -209,7 +210,7 @@ class TestSummaryCLI:
         data = json.loads(result.output)
         assert data["total_hours"] == 3.0
 
-    def test_project_filter(self, tmp_path: Path) -> None:
+    def test_project_filter(self, click_app: TyperGroup, tmp_path: Path) -> None:
         db = _setup(tmp_path)
         # Add second project
         db.execute(
@@ -238,7 +239,7 @@ class TestSummaryCLI:
             entry_type="manual",
         )
         result = runner.invoke(
-            app,
+            click_app,
             [
                 *_db_args(tmp_path),
                 "--format",
@@ -256,7 +257,7 @@ class TestSummaryCLI:
         assert data["total_hours"] == 4.0
         assert len(data["projects"]) == 1
 
-    def test_full_detail_text(self, tmp_path: Path) -> None:
+    def test_full_detail_text(self, click_app: TyperGroup, tmp_path: Path) -> None:
         db = _setup(tmp_path)
         create_entry(
             db=db,
@@ -270,7 +271,7 @@ class TestSummaryCLI:
             entry_type="manual",
         )
         result = runner.invoke(
-            app,
+            click_app,
             [
                 *_db_args(tmp_path),
                 "summary",
@@ -285,7 +286,7 @@ class TestSummaryCLI:
         assert "Test Project" in result.output
         assert "2026-02-25" in result.output
 
-    def test_budget_percentage_shown(self, tmp_path: Path) -> None:
+    def test_budget_percentage_shown(self, click_app: TyperGroup, tmp_path: Path) -> None:
         db = _setup(tmp_path)
         create_entry(
             db=db,
@@ -298,7 +299,7 @@ class TestSummaryCLI:
             entry_type="manual",
         )
         result = runner.invoke(
-            app,
+            click_app,
             [
                 *_db_args(tmp_path),
                 "--format",
@@ -313,10 +314,10 @@ class TestSummaryCLI:
         data = json.loads(result.output)
         assert data["projects"][0]["budget_percent"] == 50.0
 
-    def test_invalid_project_slug(self, tmp_path: Path) -> None:
+    def test_invalid_project_slug(self, click_app: TyperGroup, tmp_path: Path) -> None:
         _setup(tmp_path)
         result = runner.invoke(
-            app,
+            click_app,
             [
                 *_db_args(tmp_path),
                 "summary",
@@ -327,7 +328,7 @@ class TestSummaryCLI:
         )
         assert result.exit_code == 1
 
-    def test_tag_filter(self, tmp_path: Path) -> None:
+    def test_tag_filter(self, click_app: TyperGroup, tmp_path: Path) -> None:
         db = _setup(tmp_path)
         create_entry(
             db=db,
@@ -352,7 +353,7 @@ class TestSummaryCLI:
             tags=["backend"],
         )
         result = runner.invoke(
-            app,
+            click_app,
             [
                 *_db_args(tmp_path),
                 "--format",
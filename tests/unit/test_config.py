@@ -3,6 +3,8 @@
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from timereg.core.config import (
     find_project_config,
     load_global_config,
@@ -39,6 +41,14 @@ class TestFindProjectConfig:
             result = find_project_config(tmp_path)
         assert result is None
 
+    def test_env_var_names_config(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        config_file = tmp_path / "elsewhere.toml"
+        config_file.write_text('[project]\nname = "Test"\nslug = "test"\n')
+        monkeypatch.setenv("TIMEREG_PROJECT_CONFIG", str(config_file))
+        assert find_project_config() == config_file
+        monkeypatch.setenv("TIMEREG_PROJECT_CONFIG", str(tmp_path / "missing.toml"))
+        assert find_project_config() is None
+
 
 class TestLoadProjectConfig:
     def test_load_full_config(self) -> None:
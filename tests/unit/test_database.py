@@ -28,6 +28,13 @@ class TestDatabaseInit:
         assert result[0] == "wal"
         db.close()
 
+    def test_uses_normal_synchronous(self, tmp_path: Path) -> None:
+        db = Database(tmp_path / "test.db")
+        result = db.execute("PRAGMA synchronous").fetchone()
+        assert result is not None
+        assert result[0] == 1
+        db.close()
+
     def test_enables_foreign_keys(self, tmp_path: Path) -> None:
         db = Database(tmp_path / "test.db")
         result = db.execute("PRAGMA foreign_keys").fetchone()
@@ -35,6 +42,21 @@ class TestDatabaseInit:
         assert result[0] == 1
         db.close()
 
+    def test_shared_memory_uri_loaded_from_file(self, tmp_path: Path) -> None:
+        source = Database(tmp_path / "source.db")
+        source.migrate()
+        source.close()
+        uri = "file:test_shared?mode=memory&cache=shared"
+        db = Database(uri)
+        db.load(tmp_path / "source.db")
+        other = Database(uri)
+        result = other.execute("SELECT MAX(version) FROM schema_version").fetchone()
+        assert result is not None
+        assert result[0] == 3
+        other.close()
+        db.close()
+        assert not (Path.cwd() / uri).exists()
+
 
 class TestMigrations:
     def test_migrate_creates_schema_version_table(self, tmp_path: Path) -> None:
@@ -71,7 +93,7 @@ class TestMigrations:
         db.migrate()
         result = db.execute("SELECT MAX(version) FROM schema_version").fetchone()
         assert result is not None
-        assert result[0] == 2
+        assert result[0] == 3
         db.close()
 
     def test_migrate_is_idempotent(self, tmp_path: Path) -> None:
@@ -80,7 +102,7 @@ class TestMigrations:
         db.migrate()  # should not raise
         result = db.execute("SELECT COUNT(*) FROM schema_version").fetchone()
         assert result is not None
-        assert result[0] == 2
+        assert result[0] == 3
         db.close()
 
     def test_migrate_applies_pending_only(self, tmp_path: Path) -> None:
@@ -110,6 +110,29 @@ class TestCreateEntry:
         assert entry.tags == ["dev", "testing"]
 
 
+class TestListEntries:
+    def test_tag_filter_matches_any_tag(self, db: Database, project_id: int) -> None:
+        for summary, tags in [
+            ("Dev", ["dev"]),
+            ("Review", ["review", "dev"]),
+            ("Meeting", ["meeting"]),
+            ("Untagged", None),
+        ]:
+            create_entry(
+                db=db,
+                project_id=project_id,
+                hours=1.0,
+                short_summary=summary,
+                entry_date=date(2026, 2, 25),
+                git_user_name="User",
+                git_user_email="user@test.com",
+                entry_type="manual",
+                tags=tags,
+            )
+        entries = list_entries(db, project_id=project_id, tag_filter=["dev", "meeting"])
+        assert [e.short_summary for e in entries] == ["Dev", "Review", "Meeting"]
+
+
 class TestCreatePeerEntry:
     def test_creates_linked_entries(self, db: Database, project_id: int) -> None:
         entries = create_entry(
@@ -218,6 +241,36 @@ class TestDeleteEntry:
         hashes = get_registered_commit_hashes(db, project_id)
         assert "abc123" in hashes
 
+    def test_delete_peers_keeps_commits_claimed(self, db: Database, project_id: int) -> None:
+        commits = [
+            CommitInfo(
+                hash="abc123",
+                message="feat: something",
+                author_name="User",
+                author_email="user@test.com",
+                timestamp="2026-02-25T10:00:00+01:00",
+                repo_path=".",
+            ),
+        ]
+        entries = create_entry(
+            db=db,
+            project_id=project_id,
+            hours=3.0,
+            short_summary="Pair programming",
+            entry_date=date(2026, 2, 25),
+            git_user_name="User",
+            git_user_email="user@test.com",
+            commits=commits,
+            entry_type="git",
+            peer_emails=["colleague@test.com"],
+        )
+        assert isinstance(entries, list)
+        assert entries[0].id is not None
+        delete_entry(db, entries[0].id, release_commits=False, delete_peers=True)
+        assert list_entries(db, project_id=project_id) == []
+        hashes = get_registered_commit_hashes(db, project_id)
+        assert "abc123" in hashes
+
 
 class TestUndoLast:
     def test_undo_deletes_last_entry(self, db: Database, project_id: int) -> None:
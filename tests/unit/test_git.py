@@ -1,25 +1,37 @@
 """Tests for git subprocess operations."""
 
 import subprocess
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from timereg.core.git import (
-    fetch_commits,
+    _stream_git,
+    fetch_commit_hashes,
     fetch_project_commits,
     get_working_tree_status,
     parse_log_output,
+    parse_status_output,
     resolve_git_user,
 )
 from timereg.core.models import FetchResult, GitUser
 
 SAMPLE_LOG_OUTPUT = (
-    "a1b2c3d4\x00feat: add signaling\x00Mr Bell\x00bell@jpro.no\x002026-02-25T09:34:12+01:00\n"
-    "3\t1\tsrc/signaling.py\n"
-    "1\t0\ttests/test_signaling.py\n"
-    "\n"
-    "b2c3d4e5\x00test: integration tests\x00Mr Bell\x00bell@jpro.no\x002026-02-25T11:02:45+01:00\n"
-    "50\t0\ttests/test_integration.py\n"
+    b"\x1ea1b2c3d4\x00feat: add signaling\x00Mr Bell\x00bell@jpro.no\x002026-02-25T09:34:12+01:00"
+    b"\x00\n3\t1\tsrc/signaling.py\x001\t0\ttests/test_signaling.py\x00"
+    b"\x1eb2c3d4e5\x00test: integration tests\x00Mr Bell\x00bell@jpro.no"
+    b"\x002026-02-25T11:02:45+01:00\x00\n50\t0\ttests/test_integration.py\x00"
+)
+
+SAMPLE_STATUS_OUTPUT = (
+    "# branch.oid 4930ffd3e0551f553adb70451af274e4f9cf4248\0"
+    "# branch.head feat/webrtc\0"
+    "1 M. N... 100644 100644 100644 6178079 b51ec5b staged_file.py\0"
+    "1 .M N... 100644 100644 100644 6178079 6178079 unstaged1.py\0"
+    "1 .M N... 100644 100644 100644 6178079 6178079 unstaged2.py\0"
+    "1 .D N... 100644 100644 000000 6178079 6178079 unstaged3.py\0"
 )
 
 
@@ -36,100 +48,134 @@ class TestParseLogOutput:
         assert commits[1].hash == "b2c3d4e5"
         assert commits[1].insertions == 50
 
+    def test_skips_registered_hashes(self) -> None:
+        commits = parse_log_output(SAMPLE_LOG_OUTPUT, repo_path=".", registered_hashes={"a1b2c3d4"})
+        assert [c.hash for c in commits] == ["b2c3d4e5"]
+
     def test_parse_empty_output(self) -> None:
-        commits = parse_log_output("", repo_path=".")
+        commits = parse_log_output(b"", repo_path=".")
         assert commits == []
 
     def test_parse_commit_no_files(self) -> None:
-        output = "abc123\x00empty commit\x00User\x00user@test.com\x002026-02-25T10:00:00+01:00\n"
+        output = (
+            b"\x1eabc123\x00empty commit\x00User\x00user@test.com\x002026-02-25T10:00:00+01:00\x00"
+        )
         commits = parse_log_output(output, repo_path=".")
         assert len(commits) == 1
         assert commits[0].files_changed == 0
 
-
-class TestFetchCommits:
-    @patch("timereg.core.git._run_git")
-    def test_fetch_returns_commits(self, mock_run: MagicMock) -> None:
-        mock_run.return_value = SAMPLE_LOG_OUTPUT
-        commits = fetch_commits(
-            repo_path="/fake/repo",
-            target_date="2026-02-25",
-            user_email="bell@jpro.no",
-            timezone="Europe/Oslo",
-        )
-        assert len(commits) == 2
-
-    @patch("timereg.core.git._run_git")
-    def test_fetch_filters_registered_hashes(self, mock_run: MagicMock) -> None:
-        mock_run.return_value = SAMPLE_LOG_OUTPUT
-        commits = fetch_commits(
-            repo_path="/fake/repo",
-            target_date="2026-02-25",
-            user_email="bell@jpro.no",
-            timezone="Europe/Oslo",
-            registered_hashes={"a1b2c3d4"},
+    def test_parse_rename_and_binary(self) -> None:
+        output = (
+            b"\x1eabc123\x00refactor\x00User\x00user@test.com\x002026-02-25T10:00:00+01:00\x00"
+            b"\n0\t0\t\x00old name.py\x00new name.py\x00-\t-\tlogo.png\x002\t1\tsrc/app.py\x00"
         )
+        commits = parse_log_output(output, repo_path=".")
         assert len(commits) == 1
-        assert commits[0].hash == "b2c3d4e5"
+        assert commits[0].files == ["new name.py", "logo.png", "src/app.py"]
+        assert commits[0].insertions == 2
+        assert commits[0].deletions == 1
+
+
+class TestStreamGit:
+    def test_failure_carries_git_error_text(self, tmp_path: Path) -> None:
+        with pytest.raises(subprocess.CalledProcessError) as excinfo:
+            list(_stream_git(["log"], cwd=tmp_path))
+        assert "not a git repository" in excinfo.value.stderr
+
 
+class TestFetchCommitHashes:
     @patch("timereg.core.git._run_git")
-    def test_fetch_empty_repo(self, mock_run: MagicMock) -> None:
-        mock_run.return_value = ""
-        commits = fetch_commits(
-            repo_path="/fake/repo",
-            target_date="2026-02-25",
-            user_email="bell@jpro.no",
-            timezone="Europe/Oslo",
+    def test_returns_hash_set(self, mock_run: MagicMock) -> None:
+        mock_run.return_value = "a1b2c3d4\nb2c3d4e5\n"
+        hashes = fetch_commit_hashes(
+            repo_path="/fake/repo", target_date="2026-02-25", user_email="bell@jpro.no"
         )
-        assert commits == []
+        assert hashes == {"a1b2c3d4", "b2c3d4e5"}
+        args = mock_run.call_args[0][0]
+        assert "--format=%H" in args
+        assert "--numstat" not in args
 
 
 class TestGetWorkingTreeStatus:
     @patch("timereg.core.git._run_git")
     def test_counts_staged_and_unstaged(self, mock_run: MagicMock) -> None:
-        def side_effect(args: list[str], cwd: str) -> str:
-            if "--cached" in args:
-                return "1\t0\tfile1.py\n2\t1\tfile2.py\n"
-            return "3\t0\tfile3.py\n"
+        mock_run.return_value = SAMPLE_STATUS_OUTPUT
+        status = get_working_tree_status("/fake/repo")
+        assert mock_run.call_count == 1
+        assert status.staged_files == 1
+        assert status.unstaged_files == 3
 
-        mock_run.side_effect = side_effect
+    @patch("timereg.core.git._run_git")
+    def test_git_failure_counts_nothing(self, mock_run: MagicMock) -> None:
+        mock_run.side_effect = subprocess.CalledProcessError(128, "git")
         status = get_working_tree_status("/fake/repo")
+        assert status.staged_files == 0
+        assert status.unstaged_files == 0
+
+
+class TestParseStatusOutput:
+    def test_counts_staged_and_unstaged(self) -> None:
+        branch, status = parse_status_output(SAMPLE_STATUS_OUTPUT)
+        assert branch == "feat/webrtc"
+        assert status.staged_files == 1
+        assert status.unstaged_files == 3
+
+    def test_file_both_staged_and_unstaged(self) -> None:
+        output = (
+            "# branch.head main\0"
+            "1 MM N... 100644 100644 100644 6178079 b51ec5b b\0"
+            "2 RM N... 100644 100644 100644 7898192 7898192 R100 c\0"
+            "1 MM weird original name\0"
+        )
+        branch, status = parse_status_output(output)
+        assert branch == "main"
         assert status.staged_files == 2
-        assert status.unstaged_files == 1
+        assert status.unstaged_files == 2
+
+    def test_detached_head(self) -> None:
+        branch, status = parse_status_output("# branch.oid abc\0# branch.head (detached)\0")
+        assert branch == "HEAD"
+        assert status.staged_files == 0
+        assert status.unstaged_files == 0
 
 
 class TestResolveGitUser:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> None:
+        resolve_git_user.cache_clear()
+
     @patch("timereg.core.git._run_git")
     def test_resolve_from_repo(self, mock_run: MagicMock) -> None:
-        def side_effect(args: list[str], cwd: str) -> str:
-            if "user.name" in args:
-                return "Mr Bell\n"
-            if "user.email" in args:
-                return "bell@jpro.no\n"
-            return ""
-
-        mock_run.side_effect = side_effect
+        mock_run.return_value = "user.name Mr Bell\nuser.email bell@jpro.no\n"
         user = resolve_git_user("/fake/repo")
         assert user.name == "Mr Bell"
         assert user.email == "bell@jpro.no"
+        assert resolve_git_user("/fake/repo") is user
+        assert mock_run.call_count == 1
+
+    @patch("timereg.core.git._run_git")
+    def test_missing_email_raises(self, mock_run: MagicMock) -> None:
+        mock_run.return_value = "user.name Mr Bell\n"
+        with pytest.raises(subprocess.CalledProcessError):
+            resolve_git_user("/fake/repo")
 
 
 def _git_side_effect(args: list[str], cwd: str) -> str:
-    """Side effect for _run_git that handles log, branch, and diff commands."""
-    if "log" in args and "--format" in " ".join(args):
-        return SAMPLE_LOG_OUTPUT
-    if "rev-parse" in args and "--abbrev-ref" in args:
-        return "feat/webrtc\n"
+    """Side effect for _run_git that handles reflog and status commands."""
     if "reflog" in args:
         return ""
-    if "diff" in args and "--cached" in args:
-        return "1\t0\tstaged_file.py\n"
-    if "diff" in args:
-        return "3\t0\tunstaged1.py\n2\t1\tunstaged2.py\n0\t5\tunstaged3.py\n"
+    if "status" in args:
+        return SAMPLE_STATUS_OUTPUT
     return ""
 
 
+def _git_stream_side_effect(args: list[str], cwd: str) -> Iterator[bytes]:
+    """Stand-in for _stream_git that streams the sample log output."""
+    yield SAMPLE_LOG_OUTPUT
+
+
 class TestFetchProjectCommits:
+    @patch("timereg.core.git._stream_git", _git_stream_side_effect)
     @patch("timereg.core.git._run_git")
     def test_returns_fetch_result(self, mock_run: MagicMock) -> None:
         mock_run.side_effect = _git_side_effect
@@ -167,6 +213,7 @@ class TestFetchProjectCommits:
         assert isinstance(result, FetchResult)
         assert len(result.repos) == 0
 
+    @patch("timereg.core.git._stream_git", _git_stream_side_effect)
     @patch("timereg.core.git._run_git")
     def test_multiple_repos(self, mock_run: MagicMock) -> None:
         mock_run.side_effect = _git_side_effect
@@ -186,9 +233,32 @@ class TestFetchProjectCommits:
         assert result.repos[0].absolute_path == "/fake/repo1"
         assert result.repos[1].absolute_path == "/fake/repo2"
 
+    @patch("timereg.core.git._stream_git")
+    @patch("timereg.core.git._run_git")
+    def test_reassembles_chunked_output(self, mock_run: MagicMock, mock_stream: MagicMock) -> None:
+        mock_run.side_effect = _git_side_effect
+        chunks = [SAMPLE_LOG_OUTPUT[i : i + 7] for i in range(0, len(SAMPLE_LOG_OUTPUT), 7)]
+        mock_stream.return_value = iter(chunks)
+        with patch.object(Path, "is_dir", return_value=True):
+            result = fetch_project_commits(
+                repo_paths=[Path("/fake/repo")],
+                target_date="2026-02-25",
+                user_email="bell@jpro.no",
+                registered_hashes=set(),
+                user=GitUser(name="Mr Bell", email="bell@jpro.no"),
+                project_name="Test",
+                project_slug="test",
+            )
+        commits = result.repos[0].commits
+        assert [c.hash for c in commits] == ["a1b2c3d4", "b2c3d4e5"]
+        assert commits[0].files == ["src/signaling.py", "tests/test_signaling.py"]
+        assert commits[1].insertions == 50
+
+    @patch("timereg.core.git._stream_git")
     @patch("timereg.core.git._run_git")
-    def test_skips_repos_on_git_error(self, mock_run: MagicMock) -> None:
+    def test_skips_repos_on_git_error(self, mock_run: MagicMock, mock_stream: MagicMock) -> None:
         mock_run.side_effect = subprocess.CalledProcessError(128, "git")
+        mock_stream.side_effect = subprocess.CalledProcessError(128, "git")
         with patch.object(Path, "is_dir", return_value=True):
             result = fetch_project_commits(
                 repo_paths=[Path("/broken/repo")],
@@ -201,6 +271,7 @@ class TestFetchProjectCommits:
             )
         assert len(result.repos) == 0
 
+    @patch("timereg.core.git._stream_git", _git_stream_side_effect)
     @patch("timereg.core.git._run_git")
     def test_relative_path_with_config_dir(self, mock_run: MagicMock) -> None:
         mock_run.side_effect = _git_side_effect
@@ -217,6 +288,7 @@ class TestFetchProjectCommits:
             )
         assert result.repos[0].relative_path == "subrepo"
 
+    @patch("timereg.core.git._stream_git", _git_stream_side_effect)
     @patch("timereg.core.git._run_git")
     def test_filters_registered_hashes(self, mock_run: MagicMock) -> None:
         mock_run.side_effect = _git_side_effect
@@ -10,6 +10,7 @@ from timereg.core.projects import (
     add_project,
     auto_register_project,
     get_project,
+    get_projects_by_ids,
     list_projects,
     remove_project,
     resolve_project,
@@ -122,6 +123,21 @@ class TestGetProject:
         assert get_project(db, "nonexistent") is None
 
 
+class TestGetProjectsByIds:
+    def test_returns_only_requested(self, db: Database) -> None:
+        a = add_project(db, "A", "a")
+        add_project(db, "B", "b")
+        c = add_project(db, "C", "c")
+        assert a.id is not None
+        assert c.id is not None
+        projects = get_projects_by_ids(db, [a.id, c.id, 999])
+        assert {pid: p.slug for pid, p in projects.items()} == {a.id: "a", c.id: "c"}
+
+    def test_empty_ids(self, db: Database) -> None:
+        add_project(db, "A", "a")
+        assert get_projects_by_ids(db, []) == {}
+
+
 class TestListProjects:
     def test_list_empty(self, db: Database) -> None:
         projects = list_projects(db)
@@ -234,3 +250,19 @@ class TestAutoRegisterBudgetAndTags:
         fetched = get_project(tmp_db, "test-model")
         assert fetched is not None
         assert fetched.weekly_hours == 15.0
+
+    def test_list_projects_without_tags(self, tmp_db: Database, tmp_path: Path) -> None:
+        config = ProjectConfig(
+            name="Test",
+            slug="test-lite",
+            weekly_budget_hours=15.0,
+            allowed_tags=["dev", "review"],
+        )
+        config_path = tmp_path / ".timereg.toml"
+        config_path.touch()
+        auto_register_project(tmp_db, config, config_path, [])
+        [full] = list_projects(tmp_db)
+        [lite] = list_projects(tmp_db, load_tags=False)
+        assert full.allowed_tags == ["dev", "review"]
+        assert lite.allowed_tags is None
+        assert lite.weekly_hours == 15.0
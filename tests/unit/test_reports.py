@@ -135,6 +135,26 @@ class TestGenerateSummary:
         assert days_with_entries[0].total_hours == 7.0  # Feb 24
         assert days_with_entries[1].total_hours == 5.0  # Feb 25
 
+    def test_full_detail_matches_brief_totals(self, tmp_db: Database) -> None:
+        pid = _setup_project(tmp_db)
+        _add_entry(tmp_db, pid, 4.0, date(2026, 2, 24), short_summary="first", tags=["dev"])
+        _add_entry(tmp_db, pid, 3.0, date(2026, 2, 24), short_summary="second", tags=["ops"])
+        _add_entry(tmp_db, pid, 5.0, date(2026, 2, 25), short_summary="third", tags=["dev"])
+
+        brief = generate_summary(tmp_db, period="week", reference_date=date(2026, 2, 25))
+        full = generate_summary(
+            tmp_db, period="week", reference_date=date(2026, 2, 25), detail="full"
+        )
+        assert [d.total_hours for d in brief.projects[0].days] == [7.0, 5.0]
+        assert [d.total_hours for d in full.projects[0].days] == [7.0, 5.0]
+        assert all(d.entries == [] for d in brief.projects[0].days)
+        assert [e.short_summary for e in full.projects[0].days[0].entries] == ["first", "second"]
+
+        tagged = generate_summary(
+            tmp_db, period="week", reference_date=date(2026, 2, 25), tag_filter=["dev"]
+        )
+        assert [d.total_hours for d in tagged.projects[0].days] == [4.0, 5.0]
+
     def test_period_label_week(self, tmp_db: Database) -> None:
         _setup_project(tmp_db)
         report = generate_summary(
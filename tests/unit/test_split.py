@@ -244,6 +244,10 @@ class TestRoundToNearest:
         result = round_to_nearest(2.05, 5)
         assert abs(result - 2.0833) < 0.001
 
+    def test_round_to_10_minutes_has_no_float_noise(self) -> None:
+        assert round_to_nearest(0.17, 10) == 0.1667
+        assert round_to_nearest(1.3, 10) == 1.3333
+
     def test_round_to_1_minute(self) -> None:
         # 1min = 0.01667h steps
         assert round_to_nearest(2.0, 1) == 2.0
@@ -1,10 +1,11 @@
 """Tests for time string parser."""
 
+import re
 import warnings
 
 import pytest
 
-from timereg.core.time_parser import parse_time
+from timereg.core.time_parser import _scan_hm, parse_time
 
 
 class TestValidFormats:
@@ -59,3 +60,35 @@ class TestEdgeCases:
 
     def test_whitespace_stripped(self) -> None:
         assert parse_time("  2h30m  ") == 2.5
+
+
+class TestScanHoursMinutes:
+    _ORACLE = re.compile(r"^(?:(\d+)h)?(?:(\d+)m)?$")
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2h30m",
+            "2h",
+            "30m",
+            "0h",
+            "007m",
+            "h",
+            "m",
+            "hm",
+            "h30m",
+            "2m3h",
+            "2h3",
+            "2hh",
+            "2h3m4m",
+            "1h 2m",
+            "-1h",
+            "1.5h",
+            "",
+            "\u0663h",
+        ],
+    )
+    def test_matches_regex_grammar(self, value: str) -> None:
+        match = self._ORACLE.match(value)
+        expected = (int(match[1] or 0), int(match[2] or 0)) if match else None
+        assert _scan_hm(value) == expected